@@ -0,0 +1,124 @@
+import streamlit as st
+import threading
+import time
+from typing import Dict, Any, Callable, Optional
+
+# Durée de validité du statut affiché ; au-delà, une lecture relance une vérification (secondes)
+STATUS_POLL_INTERVAL = 30
+
+@st.cache_resource(show_spinner=False)
+def get_document_service():
+    """
+    Retourne l'instance partagée du DocumentService.
+
+    L'instance est construite une seule fois puis réutilisée entre les reruns
+    Streamlit et les sessions.
+
+    Returns:
+        Instance du DocumentService
+    """
+    from core.services.document_service import DocumentService
+    return DocumentService()
+
+class _StatusRefresher:
+    """
+    Conserve le dernier statut du service et le rafraîchit à la demande.
+
+    Le rendu Streamlit lit le dernier statut connu sans jamais attendre la
+    sonde LLM, même lorsque l'endpoint est lent ou injoignable. Un statut
+    plus ancien que l'intervalle déclenche une seule vérification en
+    arrière-plan : sans session ouverte, aucun appel LLM n'est effectué.
+    """
+
+    def __init__(self, service_factory: Callable[[], Any], interval: float = STATUS_POLL_INTERVAL):
+        """
+        Initialise le cache de statut (la première vérification est lancée
+        à la première lecture).
+
+        Args:
+            service_factory: Fonction retournant le DocumentService courant
+            interval: Durée de validité d'un statut en secondes
+        """
+        self.service_factory = service_factory
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._snapshot: Dict[str, Any] = {
+            'service_initialized': False,
+            'pending': True
+        }
+        self._refreshed_at: Optional[float] = None
+        self._refreshing = False
+
+    def _refresh(self) -> None:
+        """
+        Thread de vérification : sonde le service puis publie le résultat.
+        """
+        status = self._probe()
+        with self._lock:
+            self._snapshot = status
+            self._refreshed_at = time.monotonic()
+            self._refreshing = False
+
+    def _probe(self) -> Dict[str, Any]:
+        """
+        Récupère le service courant et son statut.
+
+        Returns:
+            Dictionnaire avec le statut des composants
+        """
+        try:
+            return self.service_factory().get_service_status()
+        except Exception as e:
+            return {
+                'service_initialized': False,
+                'init_error': True,
+                'error': str(e)
+            }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Retourne une copie du dernier statut connu, en lançant une
+        vérification en arrière-plan s'il est périmé.
+
+        Returns:
+            Dictionnaire avec le statut des composants
+        """
+        with self._lock:
+            stale = self._refreshed_at is None or time.monotonic() - self._refreshed_at >= self.interval
+            if stale and not self._refreshing:
+                self._refreshing = True
+                threading.Thread(
+                    target=self._refresh,
+                    name="inspiredoc-status-refresh",
+                    daemon=True
+                ).start()
+            return dict(self._snapshot)
+
+@st.cache_resource(show_spinner=False)
+def _get_status_refresher() -> _StatusRefresher:
+    """
+    Retourne le cache de statut partagé entre les sessions.
+
+    Le service est obtenu via get_document_service() à chaque vérification :
+    un redémarrage du service (get_document_service.clear()) est pris en
+    compte à la vérification suivante.
+
+    Returns:
+        Instance partagée du _StatusRefresher
+    """
+    return _StatusRefresher(get_document_service)
+
+def fetch_service_status() -> Dict[str, Any]:
+    """
+    Retourne immédiatement le dernier statut connu du service.
+
+    Si ce statut a plus de STATUS_POLL_INTERVAL secondes, une vérification
+    est lancée en arrière-plan et sera visible au rendu suivant. Tant que la
+    première vérification n'est pas terminée, le statut contient la clé
+    'pending'. Si le service ne peut pas être construit (configuration
+    manquante...), il contient la clé 'init_error'.
+
+    Returns:
+        Dictionnaire avec le statut des composants
+    """
+    return _get_status_refresher().snapshot()
@@ -1,10 +1,19 @@
 import streamlit as st
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Dict, Any, List
 
-def show_sidebar() -> str:
+# Pages proposées par défaut dans la navigation
+_DEFAULT_PAGES = ["🏠 Accueil", "⚡ Génération", "⚙️ Paramètres", "ℹ️ À propos"]
+
+def show_sidebar(status: Optional[Dict[str, Any]] = None,
+                 pages: Optional[List[str]] = None) -> str:
     """
     Affiche la sidebar avec navigation et statut système.
     
+    Args:
+        status: Statut du service déjà récupéré (récupéré ici si absent)
+        pages: Libellés des pages de navigation
+        
     Returns:
         str: La page sélectionnée par l'utilisateur
     """
@@ -12,36 +21,65 @@ def show_sidebar() -> str:
         # Menu de navigation simplifié
         page = st.radio(
             "📍 Navigation",
-            ["🏠 Accueil", "⚡ Génération", "⚙️ Paramètres", "ℹ️ À propos"],
+            pages or _DEFAULT_PAGES,
             index=0,
             label_visibility="visible"
         )
         
-        # Affichage du statut système
-        st.markdown("---")
-        st.markdown("**🔧 Statut Système**")
-        
-        _show_system_status()
+        # Affichage du statut système (un seul bloc HTML)
+        _show_system_status(status)
         
         return page
 
-def _show_system_status() -> None:
+def _show_system_status(status: Optional[Dict[str, Any]] = None) -> None:
     """
     Affiche le statut du système dans la sidebar.
+    
+    Args:
+        status: Statut du service déjà récupéré (récupéré ici si absent)
+    """
+    if status is None:
+        from components.service_status import fetch_service_status
+        status = fetch_service_status()
+    
+    st.html(_status_html(
+        status.get('pending', False),
+        status.get('init_error', False),
+        status.get('service_initialized', False),
+        status.get('llm_connection', False)
+    ))
+
+@lru_cache(maxsize=8)
+def _status_html(pending: bool, init_error: bool, service_ok: bool, llm_ok: bool) -> str:
     """
-    try:
-        from core.services.document_service import DocumentService
-        service = DocumentService()
-        status = service.get_service_status()
+    Construit le bloc HTML du statut système.
+    
+    Le rendu ne dépend que de quelques booléens : il est mémorisé pour
+    chaque combinaison.
+    
+    Args:
+        pending: Première vérification encore en cours
+        init_error: Le service n'a pas pu être construit
+        service_ok: Le service est initialisé
+        llm_ok: La connexion LLM fonctionne
         
-        if status.get('service_initialized', False):
-            st.success("✅ Service OK")
-        else:
-            st.error("❌ Service KO")
-            
-        if status.get('llm_connection', False):
-            st.success("✅ LLM OK")
-        else:
-            st.warning("⚠️ LLM Config")
-    except Exception:
-        st.error("❌ Erreur init")
\ No newline at end of file
+    Returns:
+        Bloc HTML à afficher
+    """
+    if pending:
+        boxes = ['<div class="info-box">⏳ Vérification...</div>']
+    elif init_error:
+        boxes = ['<div class="error-box">❌ Erreur init</div>']
+    else:
+        boxes = [
+            '<div class="success-box">✅ Service OK</div>' if service_ok
+            else '<div class="error-box">❌ Service KO</div>',
+            '<div class="success-box">✅ LLM OK</div>' if llm_ok
+            else '<div class="warning-box">⚠️ LLM Config</div>'
+        ]
+    
+    return (
+        '<div class="sidebar-status"><hr><strong>🔧 Statut Système</strong>'
+        + "".join(boxes)
+        + '</div>'
+    )
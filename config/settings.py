@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import Dict, Any
 
 class Settings:
@@ -15,6 +16,9 @@ class Settings:
     PROCESSED_DIR = "data/processed"
     EXPORTS_DIR = "data/exports"
     
+    # Encodage des fichiers TXT : si défini, la détection automatique est désactivée
+    TXT_ENCODING = os.getenv("INSPIREDOC_TXT_ENCODING")
+    
     # Formats supportés
     SUPPORTED_FORMATS = ["pdf", "txt", "docx"]
     
@@ -38,18 +42,21 @@ class Settings:
     }
     
     @classmethod
+    @lru_cache(maxsize=None)
     def get_upload_path(cls) -> str:
-        """Retourne le chemin absolu du dossier d'upload."""
+        """Retourne le chemin absolu du dossier d'upload (calculé une seule fois)."""
         return os.path.abspath(cls.UPLOAD_DIR)
     
     @classmethod
+    @lru_cache(maxsize=None)
     def get_processed_path(cls) -> str:
-        """Retourne le chemin absolu du dossier de traitement."""
+        """Retourne le chemin absolu du dossier de traitement (calculé une seule fois)."""
         return os.path.abspath(cls.PROCESSED_DIR)
     
     @classmethod
+    @lru_cache(maxsize=None)
     def get_exports_path(cls) -> str:
-        """Retourne le chemin absolu du dossier d'export."""
+        """Retourne le chemin absolu du dossier d'export (calculé une seule fois)."""
         return os.path.abspath(cls.EXPORTS_DIR)
     
     @classmethod
@@ -1,29 +1,86 @@
+import hashlib
+import importlib.util
+import io
 import logging
-from typing import Dict, Any, List
-from pathlib import Path
+import os
+import posixpath
+import threading
+import zipfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Tuple, TYPE_CHECKING
 
-try:
-    from docx import Document
-except ImportError:
+# Vérification de disponibilité sans charger python-docx (importé à l'usage)
+if importlib.util.find_spec("docx") is None:
     raise ImportError("Veuillez installer python-docx: pip install python-docx")
 
+if TYPE_CHECKING:
+    from docx.document import Document
+
 logger = logging.getLogger(__name__)
 
+# Nombre maximal de documents conservés dans le cache d'extraction
+_CACHE_MAX_ENTRIES = 64
+
+# Séparateurs entre les sections du texte extrait
+_SEP_MAIN = "\n" + "=" * 50 + " CONTENU PRINCIPAL " + "=" * 50 + "\n"
+_SEP_TABLES = "\n" + "=" * 50 + " TABLEAUX " + "=" * 50 + "\n"
+_SEP_FOOTERS = "\n" + "=" * 50 + " PIEDS DE PAGE " + "=" * 50 + "\n"
+
+# Taille (décompressée) de word/document.xml à partir de laquelle le document
+# est lu en flux avec lxml plutôt qu'avec le modèle objet de python-docx
+STREAMING_MIN_XML_BYTES = 2 * 1024 * 1024
+
+# Nombre de tableaux à partir duquel ils sont formatés par plusieurs threads
+PARALLEL_MIN_TABLES = 8
+
+# Nombre maximal de threads utilisés pour formater les tableaux
+TABLE_WORKERS = 4
+
+# Espaces de noms et relations OOXML utilisés par la lecture en flux
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+_RT_OFFICE_DOCUMENT = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+_RT_CORE_PROPERTIES = "http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties"
+
+# Texte produit par chaque élément d'un run (mêmes règles que python-docx)
+_RUN_TEXT = {
+    _W + "tab": "\t",
+    _W + "ptab": "\t",
+    _W + "cr": "\n",
+    _W + "noBreakHyphen": "-",
+}
+
 class DOCXLoader:
     """
     Classe pour charger et extraire le texte des fichiers DOCX.
+    
+    Les résultats d'extraction sont mémorisés par contenu (empreinte du
+    fichier) : recharger un document identique, même sous un autre nom,
+    évite de reparcourir tout l'arbre XML.
     """
     
-    def __init__(self, include_headers: bool = True, include_footers: bool = True):
+    _cache: "OrderedDict[Tuple[str, bool, bool, bool], Dict[str, Any]]" = OrderedDict()
+    _digests: "OrderedDict[Tuple[str, int, int], str]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    
+    def __init__(self,
+                 include_headers: bool = True,
+                 include_footers: bool = True,
+                 include_metadata: bool = True):
         """
         Initialise le loader DOCX.
         
         Args:
             include_headers: Inclure les en-têtes dans l'extraction
             include_footers: Inclure les pieds de page dans l'extraction
+            include_metadata: Inclure les propriétés du document (titre,
+                auteur, dates) dans les métadonnées
         """
         self.include_headers = include_headers
         self.include_footers = include_footers
+        self.include_metadata = include_metadata
         
     def load(self, file_path: str) -> Dict[str, Any]:
         """
@@ -35,63 +92,153 @@ class DOCXLoader:
         Returns:
             Dictionnaire contenant le texte extrait et les métadonnées
         """
+        # Un seul appel système : réutilisé pour l'empreinte et les métadonnées
         try:
-            doc = Document(file_path)
-            
-            # Extraction du texte principal
-            paragraphs_text = self._extract_paragraphs(doc)
-            
-            # Extraction des tableaux
-            tables_text = self._extract_tables(doc)
-            
-            # Extraction des en-têtes et pieds de page
-            headers_text = self._extract_headers(doc) if self.include_headers else []
-            footers_text = self._extract_footers(doc) if self.include_footers else []
-            
-            # Combinaison de tout le texte
-            all_text_parts = []
+            file_stats = os.stat(file_path)
+            cache_key = (
+                self._file_digest(file_path, file_stats),
+                self.include_headers,
+                self.include_footers,
+                self.include_metadata
+            )
+        except OSError:
+            file_stats = None
+            cache_key = None
+        
+        if cache_key is not None:
+            with self._cache_lock:
+                cached = self._cache.get(cache_key)
+                if cached is not None:
+                    self._cache.move_to_end(cache_key)
+            if cached is not None:
+                logger.debug("DOCX servi depuis le cache: %s", file_path)
+                return self._copy_result(cached, file_path)
+        
+        result = self._load(file_path, file_stats)
+        
+        if cache_key is not None and "error" not in result["metadata"]:
+            with self._cache_lock:
+                self._cache[cache_key] = result
+                while len(self._cache) > _CACHE_MAX_ENTRIES:
+                    self._cache.popitem(last=False)
+            return self._copy_result(result, file_path)
+        
+        return result
+    
+    @classmethod
+    def clear_cache(cls) -> None:
+        """
+        Vide le cache d'extraction partagé.
+        """
+        with cls._cache_lock:
+            cls._cache.clear()
+            cls._digests.clear()
+    
+    @classmethod
+    def _file_digest(cls, file_path: str, file_stats: os.stat_result) -> str:
+        """
+        Calcule l'empreinte du contenu d'un fichier.
+        
+        L'empreinte est mémorisée par (chemin, taille, date de modification) :
+        un fichier inchangé n'est pas relu pour être haché à nouveau.
+        
+        Args:
+            file_path: Chemin vers le fichier
+            file_stats: Résultat de os.stat pour ce fichier
             
-            if headers_text:
-                all_text_parts.extend(headers_text)
-                all_text_parts.append("\n" + "="*50 + " CONTENU PRINCIPAL " + "="*50 + "\n")
+        Returns:
+            Empreinte hexadécimale (BLAKE2b)
+        """
+        stat_key = (file_path, file_stats.st_size, file_stats.st_mtime_ns)
+        with cls._cache_lock:
+            digest = cls._digests.get(stat_key)
+        if digest is not None:
+            return digest
+        
+        with open(file_path, "rb") as f:
+            digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+        
+        with cls._cache_lock:
+            cls._digests[stat_key] = digest
+            while len(cls._digests) > _CACHE_MAX_ENTRIES:
+                cls._digests.popitem(last=False)
+        return digest
+    
+    @staticmethod
+    def _copy_result(result: Dict[str, Any], file_path: str) -> Dict[str, Any]:
+        """
+        Copie un résultat mis en cache pour l'appelant.
+        
+        Args:
+            result: Résultat d'extraction mis en cache
+            file_path: Chemin du fichier demandé
             
-            all_text_parts.extend(paragraphs_text)
+        Returns:
+            Copie indépendante du résultat
+        """
+        metadata = dict(result["metadata"])
+        metadata["file_path"] = file_path
+        return {"text": result["text"], "metadata": metadata}
+    
+    def _load(self, file_path: str, file_stats: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """
+        Extrait le contenu d'un fichier DOCX sans passer par le cache.
+        
+        Args:
+            file_path: Chemin vers le fichier DOCX
+            file_stats: Résultat de os.stat déjà obtenu (sinon recalculé)
             
-            if tables_text:
-                all_text_parts.append("\n" + "="*50 + " TABLEAUX " + "="*50 + "\n")
-                all_text_parts.extend(tables_text)
+        Returns:
+            Dictionnaire contenant le texte extrait et les métadonnées
+        """
+        try:
+            # Les extracteurs écrivent le corps et les tableaux au fil de l'eau
+            buffer = io.StringIO()
+            if self._use_streaming(file_path):
+                paragraph_count, table_count, headers_text, footers_text, core_props = \
+                    self._extract_with_lxml(file_path, buffer)
+            else:
+                paragraph_count, table_count, headers_text, footers_text, core_props = \
+                    self._extract_with_python_docx(file_path, buffer)
             
             if footers_text:
-                all_text_parts.append("\n" + "="*50 + " PIEDS DE PAGE " + "="*50 + "\n")
-                all_text_parts.extend(footers_text)
+                _write_part(buffer, _SEP_FOOTERS)
+                for text in footers_text:
+                    _write_part(buffer, text)
+            
+            full_text = buffer.getvalue()
             
-            full_text = "\n".join(all_text_parts)
+            # Les en-têtes, connus en dernier, précèdent le corps
+            if headers_text:
+                head = "\n".join([*headers_text, _SEP_MAIN])
+                full_text = f"{head}\n{full_text}" if full_text else head
             
             # Métadonnées
-            file_stats = Path(file_path).stat()
+            if file_stats is None:
+                file_stats = os.stat(file_path)
             metadata = {
                 "file_path": file_path,
                 "file_size_bytes": file_stats.st_size,
                 "total_characters": len(full_text),
-                "total_paragraphs": len(paragraphs_text),
-                "total_tables": len(tables_text),
+                "total_paragraphs": paragraph_count,
+                "total_tables": table_count,
                 "has_headers": len(headers_text) > 0,
                 "has_footers": len(footers_text) > 0,
                 "loader": "docx"
             }
             
             # Extraction des propriétés du document si disponibles
-            try:
-                core_props = doc.core_properties
-                metadata.update({
-                    "title": core_props.title or "",
-                    "author": core_props.author or "",
-                    "subject": core_props.subject or "",
-                    "created": str(core_props.created) if core_props.created else "",
-                    "modified": str(core_props.modified) if core_props.modified else ""
-                })
-            except Exception as e:
-                logger.warning(f"Impossible d'extraire les propriétés du document: {str(e)}")
+            if core_props is not None:
+                try:
+                    metadata.update({
+                        "title": core_props.title or "",
+                        "author": core_props.author or "",
+                        "subject": core_props.subject or "",
+                        "created": str(core_props.created) if core_props.created else "",
+                        "modified": str(core_props.modified) if core_props.modified else ""
+                    })
+                except Exception as e:
+                    logger.warning(f"Impossible d'extraire les propriétés du document: {str(e)}")
             
             logger.info(f"DOCX chargé: {metadata['total_paragraphs']} paragraphes, {metadata['total_tables']} tableaux")
             
@@ -112,102 +259,264 @@ class DOCXLoader:
                 }
             }
     
-    def _extract_paragraphs(self, doc: Document) -> List[str]:
+    def _use_streaming(self, file_path: str) -> bool:
         """
-        Extrait le texte des paragraphes.
+        Indique si le document doit être lu en flux avec lxml.
         
         Args:
-            doc: Document DOCX
+            file_path: Chemin vers le fichier DOCX
             
         Returns:
-            Liste des textes des paragraphes
+            True si les en-têtes/pieds de page sont exclus ou si le corps
+            du document est volumineux
         """
-        paragraphs = []
-        for paragraph in doc.paragraphs:
-            text = paragraph.text.strip()
-            if text:  # Ignorer les paragraphes vides
-                paragraphs.append(text)
-        return paragraphs
+        if not (self.include_headers or self.include_footers):
+            return True
+        
+        try:
+            with zipfile.ZipFile(file_path) as archive:
+                document_part = _main_document_part(archive)
+                return archive.getinfo(document_part).file_size >= STREAMING_MIN_XML_BYTES
+        except (OSError, KeyError, zipfile.BadZipFile):
+            # Laisser python-docx signaler l'erreur
+            return False
     
-    def _extract_tables(self, doc: Document) -> List[str]:
+    def _extract_with_python_docx(self,
+                                  file_path: str,
+                                  buffer: io.StringIO) -> Tuple[int, int, List[str], List[str], Any]:
         """
-        Extrait le texte des tableaux.
+        Extrait le contenu via le modèle objet de python-docx.
         
         Args:
-            doc: Document DOCX
+            file_path: Chemin vers le fichier DOCX
+            buffer: Tampon recevant les paragraphes puis les tableaux
             
         Returns:
-            Liste des textes des tableaux formatés
+            Tuple (nombre de paragraphes, nombre de tableaux, en-têtes,
+            pieds de page, propriétés)
         """
-        tables_text = []
+        from docx import Document
+        doc = Document(file_path)
+        
+        # Extraction du texte principal
+        paragraph_count = self._extract_paragraphs(doc, buffer)
+        
+        # Extraction des tableaux
+        table_count = self._extract_tables(doc, buffer)
+        
+        # Extraction des en-têtes et pieds de page
+        headers_text, footers_text = self._extract_headers_footers(doc)
+        
+        core_props = None
+        if self.include_metadata:
+            try:
+                core_props = doc.core_properties
+            except Exception as e:
+                logger.warning(f"Impossible d'extraire les propriétés du document: {str(e)}")
+        
+        return paragraph_count, table_count, headers_text, footers_text, core_props
+    
+    def _extract_with_lxml(self,
+                           file_path: str,
+                           buffer: io.StringIO) -> Tuple[int, int, List[str], List[str], Any]:
+        """
+        Extrait le contenu en lisant word/document.xml en flux avec lxml.
+        
+        Seuls les paragraphes et tableaux de premier niveau du corps sont
+        conservés en mémoire, le temps d'en extraire le texte. Le résultat
+        est identique à celui de python-docx.
         
-        for table_idx, table in enumerate(doc.tables, 1):
-            table_content = []
-            table_content.append(f"\n--- Tableau {table_idx} ---")
+        Args:
+            file_path: Chemin vers le fichier DOCX
+            buffer: Tampon recevant les paragraphes puis les tableaux
+            
+        Returns:
+            Tuple (nombre de paragraphes, nombre de tableaux, en-têtes,
+            pieds de page, propriétés)
+        """
+        from lxml import etree
+        
+        paragraph_count = 0
+        tables = []
+        sections = []
+        collect_sections = self.include_headers or self.include_footers
+        
+        with zipfile.ZipFile(file_path) as archive:
+            document_part = _main_document_part(archive)
+            
+            with archive.open(document_part) as xml_file:
+                body_tag = _W + "body"
+                for _, element in etree.iterparse(
+                    xml_file, events=("end",), tag=(_W + "p", _W + "tbl", _W + "sectPr")
+                ):
+                    parent = element.getparent()
+                    if parent is None or parent.tag != body_tag:
+                        continue
+                    
+                    if element.tag == _W + "p":
+                        if (text := _paragraph_text(element).strip()):
+                            _write_part(buffer, text)
+                            paragraph_count += 1
+                        if collect_sections:
+                            sect_pr = element.find(f"{_W}pPr/{_W}sectPr")
+                            if sect_pr is not None:
+                                sections.append(_section_references(sect_pr))
+                    elif element.tag == _W + "tbl":
+                        tables.append(_table_rows(element))
+                    elif collect_sections:
+                        sections.append(_section_references(element))
+                    
+                    # Libérer l'élément traité et ceux qui le précèdent
+                    element.clear(keep_tail=True)
+                    while element.getprevious() is not None:
+                        del parent[0]
             
-            for row_idx, row in enumerate(table.rows):
-                row_cells = []
-                for cell in row.cells:
-                    cell_text = cell.text.strip().replace('\n', ' ')
-                    row_cells.append(cell_text)
-                
-                # Joindre les cellules avec des séparateurs
-                row_text = " | ".join(row_cells)
-                if row_text.strip():  # Ignorer les lignes vides
-                    table_content.append(row_text)
+            table_count = _write_tables(buffer, map(_format_table_rows, tables))
             
-            if len(table_content) > 1:  # Si le tableau a du contenu
-                tables_text.append("\n".join(table_content))
+            headers_text, footers_text = self._extract_headers_footers_lxml(
+                archive, document_part, sections
+            )
+            core_props = None
+            if self.include_metadata:
+                try:
+                    core_props = _read_core_properties(archive)
+                except Exception as e:
+                    logger.warning(f"Impossible d'extraire les propriétés du document: {str(e)}")
         
-        return tables_text
+        return paragraph_count, table_count, headers_text, footers_text, core_props
     
-    def _extract_headers(self, doc: Document) -> List[str]:
+    def _extract_headers_footers_lxml(self,
+                                      archive: zipfile.ZipFile,
+                                      document_part: str,
+                                      sections: List[Dict[str, Optional[str]]]) -> Tuple[List[str], List[str]]:
         """
-        Extrait le texte des en-têtes.
+        Extrait les en-têtes et pieds de page par défaut de chaque section.
+        
+        Une section sans définition propre reprend celle de la section
+        précédente, comme dans Word.
         
         Args:
-            doc: Document DOCX
+            archive: Archive DOCX ouverte
+            document_part: Chemin de la partie principale dans l'archive
+            sections: Références d'en-tête/pied de page de chaque section
             
         Returns:
-            Liste des textes des en-têtes
+            Tuple (textes des en-têtes, textes des pieds de page)
         """
         headers = []
+        footers = []
+        
+        if not (self.include_headers or self.include_footers):
+            return headers, footers
         
         try:
-            for section in doc.sections:
-                header = section.header
-                for paragraph in header.paragraphs:
-                    text = paragraph.text.strip()
-                    if text:
-                        headers.append(f"[EN-TÊTE] {text}")
+            from lxml import etree
+            
+            targets = _part_relationships(archive, document_part)
+            parsed = {}
+            
+            def part_paragraphs(rel_id: Optional[str]) -> List[str]:
+                part_name = targets.get(rel_id)
+                if part_name is None:
+                    return []
+                if part_name not in parsed:
+                    root = etree.fromstring(archive.read(part_name))
+                    parsed[part_name] = [
+                        text for p in root.iterchildren(_W + "p")
+                        if (text := _paragraph_text(p).strip())
+                    ]
+                return parsed[part_name]
+            
+            header_ref = footer_ref = None
+            for refs in sections:
+                header_ref = refs["header"] or header_ref
+                footer_ref = refs["footer"] or footer_ref
+                if self.include_headers:
+                    headers.extend(f"[EN-TÊTE] {text}" for text in part_paragraphs(header_ref))
+                if self.include_footers:
+                    footers.extend(f"[PIED DE PAGE] {text}" for text in part_paragraphs(footer_ref))
         except Exception as e:
-            logger.warning(f"Erreur lors de l'extraction des en-têtes: {str(e)}")
+            logger.warning(f"Erreur lors de l'extraction des en-têtes/pieds de page: {str(e)}")
         
-        return headers
+        return headers, footers
     
-    def _extract_footers(self, doc: Document) -> List[str]:
+    def _extract_paragraphs(self, doc: "Document", buffer: io.StringIO) -> int:
         """
-        Extrait le texte des pieds de page.
+        Écrit le texte des paragraphes dans le tampon.
         
         Args:
             doc: Document DOCX
+            buffer: Tampon de sortie
             
         Returns:
-            Liste des textes des pieds de page
+            Nombre de paragraphes écrits
+        """
+        count = 0
+        for paragraph in doc.paragraphs:
+            # Ignorer les paragraphes vides
+            if (text := paragraph.text.strip()):
+                _write_part(buffer, text)
+                count += 1
+        return count
+    
+    def _extract_tables(self, doc: "Document", buffer: io.StringIO) -> int:
         """
+        Écrit le texte des tableaux formatés dans le tampon.
+        
+        Les documents comportant de nombreux tableaux sont formatés par un
+        pool de threads (les requêtes XPath de lxml relâchent le GIL), puis
+        réassemblés dans l'ordre d'origine.
+        
+        Args:
+            doc: Document DOCX
+            buffer: Tampon de sortie
+            
+        Returns:
+            Nombre de tableaux écrits
+        """
+        tables = doc.tables
+        workers = min(TABLE_WORKERS, os.cpu_count() or 1, len(tables))
+        
+        if len(tables) >= PARALLEL_MIN_TABLES and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return _write_tables(buffer, list(executor.map(_format_docx_table, tables)))
+        
+        return _write_tables(buffer, map(_format_docx_table, tables))
+    
+    def _extract_headers_footers(self, doc: "Document") -> Tuple[List[str], List[str]]:
+        """
+        Extrait les en-têtes et pieds de page en un seul parcours des sections.
+        
+        Args:
+            doc: Document DOCX
+            
+        Returns:
+            Tuple (textes des en-têtes, textes des pieds de page)
+        """
+        headers = []
         footers = []
         
+        if not (self.include_headers or self.include_footers):
+            return headers, footers
+        
         try:
             for section in doc.sections:
-                footer = section.footer
-                for paragraph in footer.paragraphs:
-                    text = paragraph.text.strip()
-                    if text:
-                        footers.append(f"[PIED DE PAGE] {text}")
+                if self.include_headers:
+                    headers.extend(
+                        f"[EN-TÊTE] {text}"
+                        for paragraph in section.header.paragraphs
+                        if (text := paragraph.text.strip())
+                    )
+                if self.include_footers:
+                    footers.extend(
+                        f"[PIED DE PAGE] {text}"
+                        for paragraph in section.footer.paragraphs
+                        if (text := paragraph.text.strip())
+                    )
         except Exception as e:
-            logger.warning(f"Erreur lors de l'extraction des pieds de page: {str(e)}")
+            logger.warning(f"Erreur lors de l'extraction des en-têtes/pieds de page: {str(e)}")
         
-        return footers
+        return headers, footers
     
     @staticmethod
     def is_valid_docx(file_path: str) -> bool:
@@ -221,7 +530,271 @@ class DOCXLoader:
             True si le fichier est un DOCX valide
         """
         try:
-            Document(file_path)
-            return True
+            # Lecture du seul répertoire central de l'archive, sans parser le XML
+            if not zipfile.is_zipfile(file_path):
+                return False
+            with zipfile.ZipFile(file_path) as archive:
+                return "word/document.xml" in archive.namelist()
         except Exception:
-            return False
\ No newline at end of file
+            return False
+
+
+def _write_part(buffer: io.StringIO, text: str) -> None:
+    """
+    Ajoute un bloc de texte au tampon, séparé du précédent par un saut de ligne.
+    
+    Args:
+        buffer: Tampon de sortie
+        text: Bloc de texte à ajouter
+    """
+    if buffer.tell():
+        buffer.write("\n")
+    buffer.write(text)
+
+
+def _format_table_rows(cell_rows: Iterable[Iterable[str]]) -> List[str]:
+    """
+    Formate les lignes d'un tableau en ignorant les lignes vides.
+    
+    Args:
+        cell_rows: Lignes du tableau, chacune donnée comme textes de cellules
+        
+    Returns:
+        Liste des lignes formatées
+    """
+    # Joindre les cellules avec des séparateurs
+    return [
+        row_text for cells in cell_rows
+        if (row_text := " | ".join(cell.strip().replace('\n', ' ') for cell in cells)).strip()
+    ]
+
+
+def _format_docx_table(table) -> List[str]:
+    """
+    Formate les lignes d'un tableau python-docx.
+    
+    Args:
+        table: Tableau python-docx
+        
+    Returns:
+        Liste des lignes formatées
+    """
+    return _format_table_rows((cell.text for cell in row.cells) for row in table.rows)
+
+
+def _write_tables(buffer: io.StringIO, tables: Iterable[List[str]]) -> int:
+    """
+    Écrit les tableaux non vides dans le tampon, précédés de leur séparateur.
+    
+    Args:
+        buffer: Tampon de sortie
+        tables: Lignes formatées de chaque tableau, dans l'ordre du document
+        
+    Returns:
+        Nombre de tableaux écrits
+    """
+    count = 0
+    
+    for table_idx, rows in enumerate(tables, 1):
+        if rows:  # Si le tableau a du contenu
+            if count == 0:
+                _write_part(buffer, _SEP_TABLES)
+            _write_part(buffer, "\n".join([f"\n--- Tableau {table_idx} ---", *rows]))
+            count += 1
+    
+    return count
+
+
+def _main_document_part(archive: zipfile.ZipFile) -> str:
+    """
+    Retrouve la partie principale du document via les relations du paquet.
+    
+    Args:
+        archive: Archive DOCX ouverte
+        
+    Returns:
+        Chemin de la partie principale dans l'archive
+    """
+    for rel_type, target in _package_relationships(archive, "_rels/.rels", ""):
+        if rel_type == _RT_OFFICE_DOCUMENT:
+            return target
+    return "word/document.xml"
+
+
+def _part_relationships(archive: zipfile.ZipFile, part_name: str) -> Dict[str, str]:
+    """
+    Lit les relations internes d'une partie (identifiant -> chemin).
+    
+    Args:
+        archive: Archive DOCX ouverte
+        part_name: Chemin de la partie dans l'archive
+        
+    Returns:
+        Dictionnaire des cibles par identifiant de relation
+    """
+    directory, name = posixpath.split(part_name)
+    rels_name = posixpath.join(directory, "_rels", name + ".rels")
+    return {
+        rel_id: target
+        for rel_id, target in _package_relationships(archive, rels_name, directory, with_ids=True)
+    }
+
+
+def _package_relationships(archive: zipfile.ZipFile,
+                           rels_name: str,
+                           base_dir: str,
+                           with_ids: bool = False) -> List[Tuple[str, str]]:
+    """
+    Lit un fichier de relations OPC.
+    
+    Args:
+        archive: Archive DOCX ouverte
+        rels_name: Chemin du fichier .rels dans l'archive
+        base_dir: Répertoire de référence des cibles relatives
+        with_ids: Retourner l'identifiant plutôt que le type de relation
+        
+    Returns:
+        Liste de tuples (type ou identifiant, chemin de la cible)
+    """
+    from lxml import etree
+    
+    try:
+        root = etree.fromstring(archive.read(rels_name))
+    except KeyError:
+        return []
+    
+    relationships = []
+    for rel in root.iterchildren(_PKG_REL):
+        if rel.get("TargetMode") == "External":
+            continue
+        target = rel.get("Target", "")
+        if target.startswith("/"):
+            target = target[1:]
+        else:
+            target = posixpath.normpath(posixpath.join(base_dir, target))
+        relationships.append((rel.get("Id") if with_ids else rel.get("Type"), target))
+    return relationships
+
+
+def _read_core_properties(archive: zipfile.ZipFile) -> Any:
+    """
+    Lit les propriétés du document avec le modèle de python-docx.
+    
+    Args:
+        archive: Archive DOCX ouverte
+        
+    Returns:
+        Objet CoreProperties, ou None si le paquet n'en contient pas
+    """
+    for rel_type, target in _package_relationships(archive, "_rels/.rels", ""):
+        if rel_type == _RT_CORE_PROPERTIES:
+            from docx.opc.coreprops import CoreProperties
+            from docx.oxml import parse_xml
+            return CoreProperties(parse_xml(archive.read(target)))
+    return None
+
+
+def _section_references(sect_pr) -> Dict[str, Optional[str]]:
+    """
+    Relève les références d'en-tête et de pied de page par défaut d'une section.
+    
+    Args:
+        sect_pr: Élément w:sectPr
+        
+    Returns:
+        Dictionnaire {'header': identifiant ou None, 'footer': identifiant ou None}
+    """
+    refs = {"header": None, "footer": None}
+    for kind in refs:
+        for ref in sect_pr.iterchildren(f"{_W}{kind}Reference"):
+            if ref.get(_W + "type") == "default":
+                refs[kind] = ref.get(_R + "id")
+                break
+    return refs
+
+
+def _run_text(run) -> str:
+    """
+    Calcule le texte d'un run w:r.
+    
+    Args:
+        run: Élément w:r
+        
+    Returns:
+        Texte du run
+    """
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == _W + "t":
+            parts.append(child.text or "")
+        elif tag == _W + "br":
+            if child.get(_W + "type", "textWrapping") == "textWrapping":
+                parts.append("\n")
+        elif tag in _RUN_TEXT:
+            parts.append(_RUN_TEXT[tag])
+    return "".join(parts)
+
+
+def _paragraph_text(paragraph) -> str:
+    """
+    Calcule le texte d'un paragraphe w:p (runs et hyperliens).
+    
+    Args:
+        paragraph: Élément w:p
+        
+    Returns:
+        Texte du paragraphe
+    """
+    parts = []
+    for child in paragraph:
+        if child.tag == _W + "r":
+            parts.append(_run_text(child))
+        elif child.tag == _W + "hyperlink":
+            parts.extend(_run_text(run) for run in child.iterchildren(_W + "r"))
+    return "".join(parts)
+
+
+def _table_rows(table) -> List[List[str]]:
+    """
+    Calcule le texte des cellules de chaque ligne d'un tableau w:tbl.
+    
+    Les cellules fusionnées horizontalement sont répétées et les cellules
+    fusionnées verticalement reprennent le texte de la cellule d'origine.
+    
+    Args:
+        table: Élément w:tbl
+        
+    Returns:
+        Liste des lignes, chacune étant la liste des textes de ses cellules
+    """
+    rows = []
+    cells_above: Dict[int, Tuple[str, ...]] = {}
+    
+    for row in table.iterchildren(_W + "tr"):
+        grid_before = row.find(f"{_W}trPr/{_W}gridBefore")
+        offset = int(grid_before.get(_W + "val")) if grid_before is not None else 0
+        row_cells = {}
+        cells = []
+        
+        for cell in row.iterchildren(_W + "tc"):
+            grid_span = cell.find(f"{_W}tcPr/{_W}gridSpan")
+            span = int(grid_span.get(_W + "val")) if grid_span is not None else 1
+            v_merge = cell.find(f"{_W}tcPr/{_W}vMerge")
+            
+            if v_merge is not None and v_merge.get(_W + "val", "continue") == "continue":
+                if offset not in cells_above:
+                    raise ValueError(f"no `tc` element at grid_offset={offset}")
+                texts = cells_above[offset]
+            else:
+                text = "\n".join(_paragraph_text(p) for p in cell.iterchildren(_W + "p"))
+                texts = (text,) * span
+            
+            row_cells[offset] = texts
+            cells.extend(texts)
+            offset += span
+        
+        cells_above = row_cells
+        rows.append(cells)
+    
+    return rows
@@ -1,17 +1,37 @@
+import io
+import os
+import importlib.util
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 from pathlib import Path
 
-try:
-    import pypdf
-except ImportError:
-    try:
-        import pdfplumber
-    except ImportError:
-        raise ImportError("Veuillez installer pypdf ou pdfplumber: pip install pypdf pdfplumber")
+# Vérification de disponibilité sans charger les bibliothèques (importées à l'usage)
+if importlib.util.find_spec("pypdf") is None and importlib.util.find_spec("pdfplumber") is None:
+    raise ImportError("Veuillez installer pypdf ou pdfplumber: pip install pypdf pdfplumber")
 
 logger = logging.getLogger(__name__)
 
+def _extract_page_text(page, page_num: int) -> Optional[str]:
+    """
+    Extrait le texte d'une page en journalisant les erreurs.
+    
+    Args:
+        page: Page pdfplumber ou pypdf
+        page_num: Numéro de la page (1-based)
+        
+    Returns:
+        Texte de la page ou None en cas d'erreur
+    """
+    try:
+        page_text = page.extract_text()
+        # Formatage paresseux : ce message est émis pour chaque page
+        if page_text and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Page %d: %d caractères extraits", page_num, len(page_text))
+        return page_text
+    except Exception as e:
+        logger.warning(f"Erreur extraction page {page_num}: {str(e)}")
+        return None
+
 class PDFLoader:
     """
     Classe pour charger et extraire le texte des fichiers PDF.
@@ -65,35 +85,13 @@ class PDFLoader:
         """
         import pdfplumber
         
-        text_content = []
-        metadata = {
-            "file_path": file_path,
-            "pages": 0,
-            "loader": "pdfplumber"
-        }
-        
         with pdfplumber.open(file_path) as pdf:
-            metadata["pages"] = len(pdf.pages)
-            
-            for page_num, page in enumerate(pdf.pages, 1):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content.append(page_text)
-                        logger.debug(f"Page {page_num}: {len(page_text)} caractères extraits")
-                except Exception as e:
-                    logger.warning(f"Erreur extraction page {page_num}: {str(e)}")
-                    continue
-        
-        full_text = "\n\n".join(text_content)
-        metadata["total_characters"] = len(full_text)
+            page_texts = [
+                _extract_page_text(page, page_num)
+                for page_num, page in enumerate(pdf.pages, 1)
+            ]
         
-        logger.info(f"PDF chargé: {metadata['pages']} pages, {metadata['total_characters']} caractères")
-        
-        return {
-            "text": full_text,
-            "metadata": metadata
-        }
+        return self._build_result(file_path, "pdfplumber", page_texts)
     
     def _load_with_pypdf(self, file_path: str) -> Dict[str, Any]:
         """
@@ -107,28 +105,41 @@ class PDFLoader:
         """
         import pypdf
         
-        text_content = []
+        with open(file_path, 'rb') as file:
+            pdf_reader = pypdf.PdfReader(file)
+            page_texts = [
+                _extract_page_text(page, page_num)
+                for page_num, page in enumerate(pdf_reader.pages, 1)
+            ]
+        
+        return self._build_result(file_path, "pypdf", page_texts)
+    
+    def _build_result(self, file_path: str, backend: str, page_texts: List[Optional[str]]) -> Dict[str, Any]:
+        """
+        Assemble le texte des pages et construit le résultat.
+        
+        Args:
+            file_path: Chemin vers le fichier PDF
+            backend: "pdfplumber" ou "pypdf"
+            page_texts: Textes de page dans l'ordre (None si l'extraction a échoué)
+            
+        Returns:
+            Dictionnaire avec le texte et les métadonnées
+        """
         metadata = {
             "file_path": file_path,
-            "pages": 0,
-            "loader": "pypdf"
+            "pages": len(page_texts),
+            "loader": backend
         }
         
-        with open(file_path, 'rb') as file:
-            pdf_reader = pypdf.PdfReader(file)
-            metadata["pages"] = len(pdf_reader.pages)
-            
-            for page_num, page in enumerate(pdf_reader.pages, 1):
-                try:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content.append(page_text)
-                        logger.debug(f"Page {page_num}: {len(page_text)} caractères extraits")
-                except Exception as e:
-                    logger.warning(f"Erreur extraction page {page_num}: {str(e)}")
-                    continue
-        
-        full_text = "\n\n".join(text_content)
+        buffer = io.StringIO()
+        for page_text in page_texts:
+            if page_text:
+                if buffer.tell():
+                    buffer.write("\n\n")
+                buffer.write(page_text)
+        
+        full_text = buffer.getvalue()
         metadata["total_characters"] = len(full_text)
         
         logger.info(f"PDF chargé: {metadata['pages']} pages, {metadata['total_characters']} caractères")
@@ -150,8 +161,11 @@ class PDFLoader:
             True si le fichier est un PDF valide
         """
         try:
-            with open(file_path, 'rb') as file:
-                header = file.read(4)
-                return header == b'%PDF'
+            # Lecture brute de l'en-tête, sans objet fichier bufferisé
+            fd = os.open(file_path, os.O_RDONLY)
+            try:
+                return os.read(fd, 4) == b'%PDF'
+            finally:
+                os.close(fd)
         except Exception:
             return False
\ No newline at end of file
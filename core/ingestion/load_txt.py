@@ -1,23 +1,130 @@
+import codecs
+import contextlib
+import hashlib
 import logging
-import chardet
-from typing import Dict, Any, Optional
-from pathlib import Path
+import mmap
+import os
+import threading
+from chardet import UniversalDetector
+from collections import OrderedDict
+from typing import BinaryIO, ContextManager, Dict, Any, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Nombre maximal de résultats de détection d'encodage conservés en cache
+_DETECTION_CACHE_MAX_ENTRIES = 1024
+
+# Taille de l'échantillon analysé pour détecter l'encodage (10KB)
+_SAMPLE_SIZE = 10000
+
+# Taille à partir de laquelle un fichier est projeté en mémoire (mmap)
+# plutôt que copié par file.read()
+MMAP_MIN_BYTES = 4 * 1024 * 1024
+
+# Taille des blocs décodés successivement
+_DECODE_CHUNK_SIZE = 64 * 1024
+
+# Taille des blocs fournis au détecteur, qui s'arrête dès qu'il est certain
+_DETECTOR_CHUNK_SIZE = 1024
+
+# Marques d'ordre des octets (BOM) et encodage correspondant, les BOM UTF-32
+# avant UTF-16 (celui d'UTF-32-LE commence comme celui d'UTF-16-LE). Les noms
+# sont ceux renvoyés par chardet ; les codecs utf-16/utf-32 consomment le BOM.
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, 'UTF-8-SIG'),
+    (codecs.BOM_UTF32_LE, 'UTF-32'),
+    (codecs.BOM_UTF32_BE, 'UTF-32'),
+    (codecs.BOM_UTF16_LE, 'UTF-16'),
+    (codecs.BOM_UTF16_BE, 'UTF-16'),
+)
+
+# Octets admis dans un fichier texte : caractères imprimables et contrôles
+# usuels (saut de ligne, tabulation...), à l'exception de DEL
+_TEXT_BYTES = bytes(sorted({7, 8, 9, 10, 12, 13, 27} | set(range(0x20, 0x100)) - {0x7f}))
+
+def _raw_content(file: BinaryIO) -> ContextManager[Union[bytes, mmap.mmap]]:
+    """
+    Donne accès au contenu brut d'un fichier ouvert en binaire.
+    
+    Les gros fichiers sont projetés en mémoire : le décodage lit directement
+    les pages du fichier, sans copie complète en objet bytes.
+    
+    Args:
+        file: Fichier ouvert en mode 'rb'
+        
+    Returns:
+        Gestionnaire de contexte fournissant les octets du fichier
+    """
+    if os.fstat(file.fileno()).st_size >= MMAP_MIN_BYTES:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    return contextlib.nullcontext(file.read())
+
+def _decode_text(raw: Union[bytes, mmap.mmap], encoding: str) -> Tuple[str, int]:
+    """
+    Décode le contenu brut d'un fichier comme le ferait open() en mode texte.
+    
+    Le décodage, la normalisation des fins de ligne et le comptage des
+    lignes se font en un seul passage, par blocs de _DECODE_CHUNK_SIZE
+    octets : aucune copie intermédiaire du texte complet n'est créée.
+    
+    Args:
+        raw: Octets du fichier (bytes ou projection mmap)
+        encoding: Encodage à utiliser
+        
+    Returns:
+        Tuple (texte aux fins de ligne normalisées en '\\n', nombre de lignes)
+    """
+    decoder = codecs.getincrementaldecoder(encoding)()
+    parts = []
+    line_count = 0
+    pending_cr = False
+    
+    size = len(raw)
+    for start in range(0, size, _DECODE_CHUNK_SIZE):
+        final = start + _DECODE_CHUNK_SIZE >= size
+        chunk = decoder.decode(raw[start:start + _DECODE_CHUNK_SIZE], final)
+        
+        # Un '\r' en fin de bloc peut être suivi d'un '\n' dans le suivant
+        if pending_cr:
+            chunk = '\r' + chunk
+        pending_cr = not final and chunk.endswith('\r')
+        if pending_cr:
+            chunk = chunk[:-1]
+        
+        if '\r' in chunk:
+            chunk = chunk.replace('\r\n', '\n').replace('\r', '\n')
+        line_count += chunk.count('\n')
+        parts.append(chunk)
+    
+    content = ''.join(parts)
+    if content and not content.endswith('\n'):
+        line_count += 1
+    
+    return content, line_count
+
 class TXTLoader:
     """
     Classe pour charger et extraire le texte des fichiers TXT.
+    
+    Les résultats de chardet sont mémorisés par empreinte de l'échantillon
+    analysé : un fichier relu (ou un autre fichier de même début) ne repasse
+    pas par la détection.
     """
     
-    def __init__(self, default_encoding: str = 'utf-8'):
+    _detection_cache: "OrderedDict[str, Tuple[Optional[str], float]]" = OrderedDict()
+    _cache_lock = threading.Lock()
+    
+    def __init__(self, default_encoding: str = 'utf-8', trust_default: bool = False):
         """
         Initialise le loader TXT.
         
         Args:
             default_encoding: Encodage par défaut à utiliser
+            trust_default: Lire directement avec l'encodage par défaut, sans
+                détection (les octets invalides sont remplacés)
         """
         self.default_encoding = default_encoding
+        self.trust_default = trust_default
         
     def load(self, file_path: str) -> Dict[str, Any]:
         """
@@ -30,25 +137,34 @@ class TXTLoader:
             Dictionnaire contenant le texte extrait et les métadonnées
         """
         try:
-            # Détection automatique de l'encodage
-            encoding = self._detect_encoding(file_path)
-            
-            # Lecture du fichier
-            with open(file_path, 'r', encoding=encoding) as file:
-                content = file.read()
+            if self.trust_default:
+                # Encodage connu : lecture texte directe, sans chardet
+                encoding = self.default_encoding
+                with open(file_path, 'r', encoding=encoding, errors='replace') as file:
+                    content = file.read()
+                    file_size = os.fstat(file.fileno()).st_size
+                line_count = content.count('\n')
+                if content and not content.endswith('\n'):
+                    line_count += 1
+            else:
+                # Lecture unique du fichier, décodé en mémoire
+                with open(file_path, 'rb') as file, _raw_content(file) as raw:
+                    # Détection automatique de l'encodage sur les premiers octets
+                    encoding = self._detect_encoding(raw[:_SAMPLE_SIZE])
+                    content, line_count = _decode_text(raw, encoding)
+                    file_size = len(raw)
             
             # Métadonnées
-            file_stats = Path(file_path).stat()
             metadata = {
                 "file_path": file_path,
                 "encoding": encoding,
-                "file_size_bytes": file_stats.st_size,
+                "file_size_bytes": file_size,
                 "total_characters": len(content),
-                "total_lines": len(content.splitlines()),
+                "total_lines": line_count,
                 "loader": "txt"
             }
             
-            logger.info(f"TXT chargé: {metadata['total_lines']} lignes, {metadata['total_characters']} caractères")
+            logger.info("TXT chargé: %d lignes, %d caractères", metadata['total_lines'], metadata['total_characters'])
             
             return {
                 "text": content,
@@ -56,7 +172,7 @@ class TXTLoader:
             }
             
         except Exception as e:
-            logger.error(f"Erreur lors du chargement du TXT {file_path}: {str(e)}")
+            logger.error("Erreur lors du chargement du TXT %s: %s", file_path, e)
             return {
                 "text": "",
                 "metadata": {
@@ -67,39 +183,85 @@ class TXTLoader:
                 }
             }
     
-    def _detect_encoding(self, file_path: str) -> str:
+    def _detect_encoding(self, sample: bytes) -> str:
         """
-        Détecte l'encodage d'un fichier texte.
+        Détecte l'encodage d'un fichier texte à partir de ses premiers octets.
         
         Args:
-            file_path: Chemin vers le fichier
+            sample: Échantillon du début du fichier
             
         Returns:
             Encodage détecté ou encodage par défaut
         """
+        # Échantillon ASCII pur : UTF-8 le décode forcément, inutile d'appeler
+        # chardet (et UTF-8 reste valable si la suite du fichier ne l'est plus)
+        if sample and sample.isascii():
+            return 'utf-8'
+        
+        # Un BOM désigne l'encodage sans ambiguïté
+        for bom, encoding in _BOM_ENCODINGS:
+            if sample.startswith(bom):
+                return encoding
+        
         try:
-            # Lire un échantillon du fichier pour détecter l'encodage
-            with open(file_path, 'rb') as file:
-                raw_data = file.read(10000)  # Lire les premiers 10KB
-            
             # Utiliser chardet pour détecter l'encodage
-            result = chardet.detect(raw_data)
-            detected_encoding = result.get('encoding')
-            confidence = result.get('confidence', 0)
+            detected_encoding, confidence = self._detect_cached(sample)
             
-            logger.debug(f"Encodage détecté: {detected_encoding} (confiance: {confidence:.2f})")
+            logger.debug("Encodage détecté: %s (confiance: %.2f)", detected_encoding, confidence)
             
             # Si la confiance est faible, utiliser l'encodage par défaut
             if confidence < 0.7 or not detected_encoding:
-                logger.warning(f"Confiance faible pour l'encodage détecté, utilisation de {self.default_encoding}")
+                logger.warning("Confiance faible pour l'encodage détecté, utilisation de %s", self.default_encoding)
                 return self.default_encoding
             
             return detected_encoding
             
         except Exception as e:
-            logger.warning(f"Erreur lors de la détection d'encodage: {str(e)}, utilisation de {self.default_encoding}")
+            logger.warning("Erreur lors de la détection d'encodage: %s, utilisation de %s", e, self.default_encoding)
             return self.default_encoding
     
+    @classmethod
+    def _detect_cached(cls, sample: bytes) -> Tuple[Optional[str], float]:
+        """
+        Exécute chardet sur un échantillon, en réutilisant un résultat mis en cache.
+        
+        Args:
+            sample: Octets analysés
+            
+        Returns:
+            Tuple (encodage détecté ou None, confiance)
+        """
+        key = hashlib.blake2b(sample, digest_size=16).hexdigest()
+        
+        with cls._cache_lock:
+            cached = cls._detection_cache.get(key)
+            if cached is not None:
+                cls._detection_cache.move_to_end(key)
+                return cached
+        
+        detector = UniversalDetector()
+        for start in range(0, len(sample), _DETECTOR_CHUNK_SIZE):
+            detector.feed(sample[start:start + _DETECTOR_CHUNK_SIZE])
+            if detector.done:
+                break
+        result = detector.close()
+        detected = (result.get('encoding'), result.get('confidence', 0))
+        
+        with cls._cache_lock:
+            cls._detection_cache[key] = detected
+            while len(cls._detection_cache) > _DETECTION_CACHE_MAX_ENTRIES:
+                cls._detection_cache.popitem(last=False)
+        
+        return detected
+    
+    @classmethod
+    def clear_detection_cache(cls) -> None:
+        """
+        Vide le cache de détection d'encodage partagé.
+        """
+        with cls._cache_lock:
+            cls._detection_cache.clear()
+    
     def load_with_encoding(self, file_path: str, encoding: str) -> Dict[str, Any]:
         """
         Charge un fichier TXT avec un encodage spécifique.
@@ -112,21 +274,21 @@ class TXTLoader:
             Dictionnaire contenant le texte extrait et les métadonnées
         """
         try:
-            with open(file_path, 'r', encoding=encoding) as file:
-                content = file.read()
+            with open(file_path, 'rb') as file, _raw_content(file) as raw:
+                content, line_count = _decode_text(raw, encoding)
+                file_size = len(raw)
             
-            file_stats = Path(file_path).stat()
             metadata = {
                 "file_path": file_path,
                 "encoding": encoding,
-                "file_size_bytes": file_stats.st_size,
+                "file_size_bytes": file_size,
                 "total_characters": len(content),
-                "total_lines": len(content.splitlines()),
+                "total_lines": line_count,
                 "loader": "txt",
                 "forced_encoding": True
             }
             
-            logger.info(f"TXT chargé avec encodage {encoding}: {metadata['total_lines']} lignes")
+            logger.info("TXT chargé avec encodage %s: %d lignes", encoding, metadata['total_lines'])
             
             return {
                 "text": content,
@@ -134,7 +296,7 @@ class TXTLoader:
             }
             
         except Exception as e:
-            logger.error(f"Erreur lors du chargement du TXT avec encodage {encoding}: {str(e)}")
+            logger.error("Erreur lors du chargement du TXT avec encodage %s: %s", encoding, e)
             return {
                 "text": "",
                 "metadata": {
@@ -164,8 +326,7 @@ class TXTLoader:
             
             # Vérifier s'il y a des caractères de contrôle non-texte
             # (en excluant les caractères de saut de ligne normaux)
-            text_characters = bytearray({7,8,9,10,12,13,27} | set(range(0x20, 0x100)) - {0x7f})
-            return bool(sample.translate(None, text_characters) == b'')
+            return not sample.translate(None, _TEXT_BYTES)
             
         except Exception:
             return False
\ No newline at end of file
@@ -1,14 +1,81 @@
 import os
+import copy
 import json
+import asyncio
+import hashlib
+import importlib.util
 import logging
+import threading
+import time
+from collections import OrderedDict
 import requests
-from typing import Optional, List, Dict, Tuple, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, List, Dict, Tuple, Any, Iterator
 from datetime import datetime
 
 from config.settings import Settings
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# HTTP/2 pour le client asynchrone si le paquet h2 est installé
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Durée de validité du dernier test de connexion (secondes)
+CONNECTION_TEST_TTL = 60
+
+# Cache des réponses déterministes (temperature = 0)
+_PROMPT_CACHE_MAX_ENTRIES = 512
+PROMPT_CACHE_TTL = 3600
+
+# Nouvelles tentatives sur les erreurs transitoires. Le POST n'est pas
+# idempotent (chaque génération est facturée) : il n'est rejoué que lorsque
+# le serveur n'a pas pu traiter la requête - échec de connexion (requête
+# jamais envoyée), 429 ou 503 (requête refusée). Aucune nouvelle tentative
+# après un délai de lecture dépassé ou un 500/502/504, où la génération a
+# pu avoir lieu.
+_RETRY_POLICY = Retry(
+    total=3,
+    read=0,
+    backoff_factor=0.3,
+    status_forcelist=(429, 503),
+    allowed_methods=frozenset({"POST"}),
+    raise_on_status=False
+)
+
+def _dumps(payload: Dict[str, Any]) -> bytes:
+    """
+    Sérialise le payload en JSON (orjson si disponible).
+    
+    Args:
+        payload: Corps de la requête
+        
+    Returns:
+        JSON encodé en UTF-8
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+def _loads(content: bytes) -> Any:
+    """
+    Désérialise une réponse JSON (orjson si disponible).
+    
+    Args:
+        content: Corps brut de la réponse
+        
+    Returns:
+        Données décodées
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
 class LLMCaller:
     """
     Classe pour appeler les modèles de langage (GPT-4o et autres).
@@ -39,7 +106,32 @@ class LLMCaller:
         if not self.api_key or not self.endpoint:
             raise ValueError("❌ API Key ou endpoint GPT-4o non définis.")
         
-        logger.info(f"✅ LLM configuré: {self.model_name} avec endpoint {self.endpoint}")
+        # URL de l'API - utiliser l'endpoint complet s'il contient déjà le chemin
+        if "/deployments/" in self.endpoint:
+            self._url = self.endpoint
+        else:
+            self._url = f"{self.endpoint}/deployments/{self.model_name}/chat/completions?api-version=2024-06-01"
+        
+        # Headers constants pour tous les appels
+        self._headers = {
+            "Ocp-Apim-Subscription-Key": self.api_key,
+            "Content-Type": "application/json"
+        }
+        
+        # Session HTTP réutilisée : connexions TCP/TLS conservées entre les appels
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=_RETRY_POLICY)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        # Dernier résultat du test de connexion : (instant monotone, succès)
+        self._conn_cache: Optional[Tuple[float, bool]] = None
+        
+        # Réponses en cache par empreinte de prompt : clé -> (instant monotone, résultat)
+        self._prompt_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._prompt_cache_lock = threading.Lock()
+        
+        logger.info("✅ LLM configuré: %s avec endpoint %s", self.model_name, self.endpoint)
     
     def call_model(self, 
                    system_prompt: str,
@@ -58,134 +150,408 @@ class LLMCaller:
         Returns:
             Dictionnaire avec la réponse et les métadonnées
         """
-        try:
-            # Fusionner la configuration
-            call_config = {**self.default_config}
-            if config:
-                call_config.update(config)
+        call_config, payload = self._build_payload(system_prompt, user_prompt, config, user_id)
+        
+        # Métadonnées de l'appel
+        start_time = time.perf_counter()
+        call_metadata = self._call_metadata(call_config, system_prompt, user_prompt, user_id)
+        
+        logger.info("🔄 Appel LLM: %d caractères, config: %s", call_metadata["prompt_length"], call_config)
+        
+        # Appel API
+        response, error_result = self._post(payload, call_metadata)
+        if error_result is not None:
+            return error_result
+        
+        return self._parse_response(response.content, call_metadata, start_time)
+    
+    def _build_payload(self,
+                       system_prompt: str,
+                       user_prompt: str,
+                       config: Optional[Dict[str, Any]],
+                       user_id: str,
+                       stream: bool = False) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Construit la configuration effective et le corps de la requête.
+        
+        Args:
+            system_prompt: Prompt système
+            user_prompt: Prompt utilisateur
+            config: Configuration spécifique pour cet appel
+            user_id: Identifiant utilisateur
+            stream: Demander une réponse en streaming
             
-            # Construire l'URL - utiliser l'endpoint complet s'il contient déjà le chemin
-            if "/deployments/" in self.endpoint:
-                url = self.endpoint
-            else:
-                url = f"{self.endpoint}/deployments/{self.model_name}/chat/completions?api-version=2024-06-01"
+        Returns:
+            Tuple (configuration effective, payload)
+        """
+        # Fusionner la configuration (sans copie si aucune surcharge)
+        call_config = {**self.default_config, **config} if config else dict(self.default_config)
+        
+        payload = {
+            **call_config,
+            "stream": stream,
+            "user": user_id,
+            "messages": [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_prompt}
+            ],
+            "n": 1
+        }
+        return call_config, payload
+    
+    def _call_metadata(self,
+                       call_config: Dict[str, Any],
+                       system_prompt: str,
+                       user_prompt: str,
+                       user_id: str) -> Dict[str, Any]:
+        """
+        Construit les métadonnées communes d'un appel.
+        
+        Args:
+            call_config: Configuration effective de l'appel
+            system_prompt: Prompt système
+            user_prompt: Prompt utilisateur
+            user_id: Identifiant utilisateur
             
-            # Headers
-            headers = {
-                "Ocp-Apim-Subscription-Key": self.api_key,
-                "Content-Type": "application/json"
-            }
+        Returns:
+            Dictionnaire des métadonnées de l'appel
+        """
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "model": self.model_name,
+            "config": call_config,
+            "prompt_length": len(system_prompt) + len(user_prompt),
+            "user_id": user_id
+        }
+    
+    def _post(self,
+              payload: Dict[str, Any],
+              call_metadata: Dict[str, Any]) -> Tuple[Optional[requests.Response], Optional[Dict[str, Any]]]:
+        """
+        Envoie la requête à l'API.
+        
+        Args:
+            payload: Corps de la requête
+            call_metadata: Métadonnées de l'appel (pour le résultat d'erreur)
             
-            # Payload
-            payload = {
-                **call_config,
-                "stream": False,
-                "user": user_id,
-                "messages": [
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                "n": 1
-            }
+        Returns:
+            Tuple (réponse, None) en cas de succès, (None, résultat d'erreur) sinon
+        """
+        try:
+            response = self._session.post(self._url, headers=self._headers, data=_dumps(payload), timeout=60)
+            response.raise_for_status()
+            return response, None
             
-            # Métadonnées de l'appel
-            call_metadata = {
-                "timestamp": datetime.now().isoformat(),
-                "model": self.model_name,
-                "config": call_config,
-                "prompt_length": len(system_prompt) + len(user_prompt),
-                "user_id": user_id
-            }
+        except requests.exceptions.HTTPError as http_err:
+            error_response = http_err.response
+            error_message = f"Erreur HTTP API {self.model_name}: {error_response.status_code}, {error_response.text}"
+            return None, self._error_result(call_metadata, error_message, "http_error",
+                                            status_code=error_response.status_code)
             
-            logger.info(f"🔄 Appel LLM: {call_metadata['prompt_length']} caractères, config: {call_config}")
+        except requests.exceptions.Timeout:
+            error_message = f"Timeout lors de l'appel API {self.model_name}"
+            return None, self._error_result(call_metadata, error_message, "timeout")
             
-            # Appel API
-            response = requests.post(url, headers=headers, json=payload, timeout=60)
-            response.raise_for_status()
+        except Exception as e:
+            error_message = f"Exception lors de l'appel API {self.model_name}: {str(e)}"
+            return None, self._error_result(call_metadata, error_message, "general_exception",
+                                            exception=str(e))
+    
+    def _parse_response(self,
+                        content: bytes,
+                        call_metadata: Dict[str, Any],
+                        start_time: float) -> Dict[str, Any]:
+        """
+        Décode la réponse de l'API et construit le résultat.
+        
+        Args:
+            content: Corps brut de la réponse
+            call_metadata: Métadonnées de l'appel
+            start_time: Instant de début de l'appel (time.perf_counter)
             
-            # Traitement de la réponse
-            data = response.json()
+        Returns:
+            Dictionnaire avec la réponse et les métadonnées
+        """
+        try:
+            data = _loads(content)
             
             if "choices" not in data or not data["choices"]:
                 raise ValueError("Réponse API invalide: pas de choix disponibles")
             
             generated_content = data["choices"][0]["message"]["content"]
             
-            # Métadonnées de la réponse
-            response_metadata = {
+        except Exception as e:
+            error_message = f"Exception lors de l'appel API {self.model_name}: {str(e)}"
+            return self._error_result(call_metadata, error_message, "general_exception",
+                                      exception=str(e))
+        
+        # Métadonnées de la réponse
+        response_metadata = {
+            **call_metadata,
+            "success": True,
+            "response_length": len(generated_content),
+            "usage": data.get("usage", {}),
+            "finish_reason": data["choices"][0].get("finish_reason"),
+            "response_time": time.perf_counter() - start_time
+        }
+        
+        logger.info("✅ Réponse LLM reçue: %d caractères, usage: %s",
+                    response_metadata["response_length"], response_metadata["usage"])
+        
+        return {
+            "success": True,
+            "content": generated_content,
+            "metadata": response_metadata,
+            "raw_response": data
+        }
+    
+    def _error_result(self,
+                      call_metadata: Dict[str, Any],
+                      error_message: str,
+                      error_type: str,
+                      **details: Any) -> Dict[str, Any]:
+        """
+        Journalise une erreur d'appel et construit le résultat correspondant.
+        
+        Args:
+            call_metadata: Métadonnées de l'appel
+            error_message: Message d'erreur
+            error_type: Type d'erreur (http_error, timeout, general_exception)
+            **details: Métadonnées supplémentaires (status_code, exception...)
+            
+        Returns:
+            Dictionnaire de résultat en échec
+        """
+        logger.error(error_message)
+        
+        return {
+            "success": False,
+            "content": "",
+            "error": error_message,
+            "metadata": {
                 **call_metadata,
-                "success": True,
-                "response_length": len(generated_content),
-                "usage": data.get("usage", {}),
-                "finish_reason": data["choices"][0].get("finish_reason"),
-                "response_time": (datetime.now() - datetime.fromisoformat(call_metadata["timestamp"])).total_seconds()
+                "success": False,
+                "error_type": error_type,
+                **details
             }
+        }
+    
+    def stream_generate(self,
+                        system_prompt: str,
+                        user_prompt: str,
+                        config: Optional[Dict[str, Any]] = None,
+                        user_id: str = "inspiredoc-user") -> Iterator[str]:
+        """
+        Appelle le modèle en mode streaming et produit le texte au fil de l'eau.
+        
+        Les trames SSE ("data: ...") sont décodées à la réception, sans
+        accumuler le corps complet de la réponse.
+        
+        Args:
+            system_prompt: Prompt système
+            user_prompt: Prompt utilisateur
+            config: Configuration spécifique pour cet appel
+            user_id: Identifiant utilisateur
+            
+        Yields:
+            Fragments successifs du contenu généré
             
-            logger.info(f"✅ Réponse LLM reçue: {response_metadata['response_length']} caractères, usage: {response_metadata['usage']}")
+        Raises:
+            requests.exceptions.RequestException: En cas d'erreur HTTP ou réseau
+        """
+        _, payload = self._build_payload(system_prompt, user_prompt, config, user_id, stream=True)
+        
+        with self._session.post(self._url, headers=self._headers, data=_dumps(payload),
+                                timeout=60, stream=True) as response:
+            response.raise_for_status()
+            
+            for line in response.iter_lines():
+                if not line.startswith(b"data:"):
+                    continue
+                
+                frame = line[5:].strip()
+                if frame == b"[DONE]":
+                    break
+                
+                choices = _loads(frame).get("choices")
+                if not choices:
+                    continue
+                
+                delta = choices[0].get("delta", {}).get("content")
+                if delta:
+                    yield delta
+    
+    def call_model_streamed(self,
+                            system_prompt: str,
+                            user_prompt: str,
+                            config: Optional[Dict[str, Any]] = None,
+                            user_id: str = "inspiredoc-user") -> Dict[str, Any]:
+        """
+        Variante de call_model qui reçoit la réponse en streaming.
+        
+        Le contenu est réassemblé en une seule fois à la fin du flux.
+        
+        Args:
+            system_prompt: Prompt système
+            user_prompt: Prompt utilisateur
+            config: Configuration spécifique pour cet appel
+            user_id: Identifiant utilisateur
             
-            return {
+        Returns:
+            Dictionnaire avec la réponse et les métadonnées (même format que call_model)
+        """
+        call_config = {**self.default_config, **config} if config else dict(self.default_config)
+        start_time = time.perf_counter()
+        call_metadata = self._call_metadata(call_config, system_prompt, user_prompt, user_id)
+        
+        try:
+            parts = list(self.stream_generate(system_prompt, user_prompt, config, user_id))
+        except Exception as e:
+            error_message = f"Exception lors de l'appel API {self.model_name}: {str(e)}"
+            return self._error_result(call_metadata, error_message, "general_exception",
+                                      exception=str(e))
+        
+        generated_content = "".join(parts)
+        return {
+            "success": True,
+            "content": generated_content,
+            "metadata": {
+                **call_metadata,
                 "success": True,
-                "content": generated_content,
-                "metadata": response_metadata,
-                "raw_response": data
+                "response_length": len(generated_content),
+                "usage": {},
+                "finish_reason": None,
+                "response_time": time.perf_counter() - start_time
             }
+        }
+    
+    def _new_async_client(self):
+        """
+        Crée un client httpx asynchrone, à utiliser dans un bloc async with.
+        
+        Les connexions d'un AsyncClient sont liées à la boucle d'événements
+        qui les a ouvertes (chaque asyncio.run en crée une) : le client vit le
+        temps d'un appel ou d'un lot et ses connexions sont fermées à la sortie.
+        
+        Returns:
+            Instance de httpx.AsyncClient
+        """
+        try:
+            import httpx
+        except ImportError:
+            raise ImportError("Veuillez installer httpx pour les appels asynchrones: pip install httpx")
+        
+        return httpx.AsyncClient(
+            http2=_HTTP2_AVAILABLE,
+            timeout=60,
+            headers=self._headers
+        )
+    
+    async def acall_model(self,
+                          system_prompt: str,
+                          user_prompt: str,
+                          config: Optional[Dict[str, Any]] = None,
+                          user_id: str = "inspiredoc-user") -> Dict[str, Any]:
+        """
+        Variante asynchrone de call_model (httpx), pour superposer plusieurs appels.
+        
+        Args:
+            system_prompt: Prompt système
+            user_prompt: Prompt utilisateur
+            config: Configuration spécifique pour cet appel
+            user_id: Identifiant utilisateur
             
-        except requests.exceptions.HTTPError as http_err:
-            error_message = f"Erreur HTTP API {self.model_name}: {response.status_code}"
-            if hasattr(response, 'text'):
-                error_message += f", {response.text}"
+        Returns:
+            Dictionnaire avec la réponse et les métadonnées (même format que call_model)
+        """
+        async with self._new_async_client() as client:
+            return await self._acall_with_client(client, system_prompt, user_prompt, config, user_id)
+    
+    async def _acall_with_client(self,
+                                 client,
+                                 system_prompt: str,
+                                 user_prompt: str,
+                                 config: Optional[Dict[str, Any]],
+                                 user_id: str) -> Dict[str, Any]:
+        """
+        Effectue un appel asynchrone avec un client httpx déjà ouvert.
+        
+        Args:
+            client: Client httpx.AsyncClient ouvert
+            system_prompt: Prompt système
+            user_prompt: Prompt utilisateur
+            config: Configuration spécifique pour cet appel
+            user_id: Identifiant utilisateur
             
-            logger.error(error_message)
+        Returns:
+            Dictionnaire avec la réponse et les métadonnées (même format que call_model)
+        """
+        import httpx
+        
+        call_config, payload = self._build_payload(system_prompt, user_prompt, config, user_id)
+        
+        start_time = time.perf_counter()
+        call_metadata = self._call_metadata(call_config, system_prompt, user_prompt, user_id)
+        
+        logger.info("🔄 Appel LLM asynchrone: %d caractères, config: %s", call_metadata["prompt_length"], call_config)
+        
+        try:
+            response = await client.post(self._url, content=_dumps(payload))
+            response.raise_for_status()
             
-            return {
-                "success": False,
-                "content": "",
-                "error": error_message,
-                "metadata": {
-                    **call_metadata,
-                    "success": False,
-                    "error_type": "http_error",
-                    "status_code": response.status_code if 'response' in locals() else None
-                }
-            }
+        except httpx.HTTPStatusError as http_err:
+            error_message = f"Erreur HTTP API {self.model_name}: {http_err.response.status_code}, {http_err.response.text}"
+            return self._error_result(call_metadata, error_message, "http_error",
+                                      status_code=http_err.response.status_code)
             
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             error_message = f"Timeout lors de l'appel API {self.model_name}"
-            logger.error(error_message)
-            
-            return {
-                "success": False,
-                "content": "",
-                "error": error_message,
-                "metadata": {
-                    **call_metadata,
-                    "success": False,
-                    "error_type": "timeout"
-                }
-            }
+            return self._error_result(call_metadata, error_message, "timeout")
             
         except Exception as e:
             error_message = f"Exception lors de l'appel API {self.model_name}: {str(e)}"
-            logger.error(error_message)
+            return self._error_result(call_metadata, error_message, "general_exception",
+                                      exception=str(e))
+        
+        return self._parse_response(response.content, call_metadata, start_time)
+    
+    async def abatch_generate(self,
+                              prompts: List[Dict[str, Any]],
+                              config: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        """
+        Exécute plusieurs appels en parallèle (asyncio.gather), sur un même
+        client httpx fermé à la fin du lot.
+        
+        Args:
+            prompts: Données de prompt (system_prompt et user_prompt) de chaque appel
+            config: Configuration commune à tous les appels
             
-            return {
-                "success": False,
-                "content": "",
-                "error": error_message,
-                "metadata": {
-                    **call_metadata,
-                    "success": False,
-                    "error_type": "general_exception",
-                    "exception": str(e)
-                }
-            }
+        Returns:
+            Liste des résultats, dans l'ordre des prompts
+        """
+        async with self._new_async_client() as client:
+            return await asyncio.gather(*(
+                self._acall_with_client(
+                    client,
+                    prompt_data["system_prompt"],
+                    prompt_data["user_prompt"],
+                    config,
+                    "inspiredoc-user"
+                )
+                for prompt_data in prompts
+            ))
     
-    def call_with_prompt_data(self, prompt_data: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+    def call_with_prompt_data(self, prompt_data: Dict[str, Any], cache: bool = True, **kwargs) -> Dict[str, Any]:
         """
         Appelle le modèle avec des données de prompt structurées.
         
+        Les réponses déterministes (temperature à 0) sont mises en cache par
+        empreinte des prompts et de la configuration : un appel identique
+        dans les PROMPT_CACHE_TTL secondes ne refait pas la requête.
+        
         Args:
             prompt_data: Données de prompt du PromptBuilder
+            cache: Utiliser le cache des réponses déterministes
             **kwargs: Arguments supplémentaires pour l'appel
             
         Returns:
@@ -194,11 +560,66 @@ class LLMCaller:
         if "system_prompt" not in prompt_data or "user_prompt" not in prompt_data:
             raise ValueError("Données de prompt invalides: system_prompt et user_prompt requis")
         
-        return self.call_model(
+        config = kwargs.get("config")
+        call_config = {**self.default_config, **config} if config else dict(self.default_config)
+        if not cache or call_config.get("temperature", 1) > 0:
+            return self.call_model(
+                system_prompt=prompt_data["system_prompt"],
+                user_prompt=prompt_data["user_prompt"],
+                **kwargs
+            )
+        
+        key = self._prompt_cache_key(prompt_data, call_config, kwargs.get("user_id"))
+        with self._prompt_cache_lock:
+            entry = self._prompt_cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < PROMPT_CACHE_TTL:
+                self._prompt_cache.move_to_end(key)
+                logger.info("♻️ Réponse LLM servie depuis le cache")
+                return copy.deepcopy(entry[1])
+        
+        result = self.call_model(
             system_prompt=prompt_data["system_prompt"],
             user_prompt=prompt_data["user_prompt"],
             **kwargs
         )
+        
+        if result["success"]:
+            with self._prompt_cache_lock:
+                self._prompt_cache[key] = (time.monotonic(), copy.deepcopy(result))
+                self._prompt_cache.move_to_end(key)
+                while len(self._prompt_cache) > _PROMPT_CACHE_MAX_ENTRIES:
+                    self._prompt_cache.popitem(last=False)
+        
+        return result
+    
+    @staticmethod
+    def _prompt_cache_key(prompt_data: Dict[str, Any],
+                          call_config: Dict[str, Any],
+                          user_id: Optional[str]) -> str:
+        """
+        Calcule l'empreinte d'un appel pour le cache des réponses.
+        
+        Args:
+            prompt_data: Données de prompt du PromptBuilder
+            call_config: Configuration effective de l'appel
+            user_id: Identifiant utilisateur éventuel
+            
+        Returns:
+            Empreinte hexadécimale
+        """
+        hasher = hashlib.blake2b(digest_size=16)
+        for part in (prompt_data["system_prompt"], prompt_data["user_prompt"],
+                     json.dumps(call_config, sort_keys=True), user_id or ""):
+            hasher.update(part.encode("utf-8"))
+            hasher.update(b"\0")
+        return hasher.hexdigest()
+    
+    def clear_prompt_cache(self) -> None:
+        """
+        Vide le cache des réponses.
+        """
+        with self._prompt_cache_lock:
+            self._prompt_cache.clear()
     
     def generate_document(self, 
                          prompt_data: Dict[str, Any],
@@ -255,23 +676,30 @@ class LLMCaller:
         if not content.strip():
             return False
         
-        # Vérifications basiques
-        markdown_indicators = [
-            content.count('#') > 0,  # Titres
-            content.count('*') > 0 or content.count('_') > 0,  # Emphase
-            content.count('-') > 2 or content.count('*') > 2,  # Listes
-            '\n\n' in content  # Paragraphes
-        ]
-        
-        return any(markdown_indicators)
+        # Vérifications basiques, de la moins coûteuse à la plus coûteuse :
+        # les tests d'appartenance s'arrêtent à la première occurrence
+        return (
+            '#' in content  # Titres
+            or '*' in content or '_' in content  # Emphase
+            or '\n\n' in content  # Paragraphes
+            or content.count('-') > 2  # Listes
+        )
     
     def test_connection(self) -> bool:
         """
         Teste la connexion à l'API.
         
+        Le résultat est réutilisé pendant CONNECTION_TEST_TTL secondes pour
+        éviter un aller-retour réseau à chaque consultation du statut.
+        
         Returns:
             True si la connexion fonctionne
         """
+        if self._conn_cache is not None:
+            tested_at, connected = self._conn_cache
+            if time.monotonic() - tested_at < CONNECTION_TEST_TTL:
+                return connected
+        
         try:
             test_result = self.call_model(
                 system_prompt="Vous êtes un assistant de test.",
@@ -279,11 +707,14 @@ class LLMCaller:
                 config={"max_tokens": 10}
             )
             
-            return test_result["success"]
+            connected = test_result["success"]
             
         except Exception as e:
-            logger.error(f"Erreur lors du test de connexion: {str(e)}")
-            return False
+            logger.error("Erreur lors du test de connexion: %s", e)
+            connected = False
+        
+        self._conn_cache = (time.monotonic(), connected)
+        return connected
     
     def get_model_info(self) -> Dict[str, Any]:
         """
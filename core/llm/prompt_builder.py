@@ -1,9 +1,242 @@
+import hashlib
 import logging
-from typing import Dict, Any, List, Optional
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
 logger = logging.getLogger(__name__)
 
+# Une coupe recule jusqu'à la dernière fin de paragraphe si elle conserve
+# au moins cette fraction du budget
+_PARAGRAPH_CUT_MIN_RATIO = 0.5
+
+# Dernier horodatage formaté : (seconde epoch, chaîne ISO)
+_iso_cache: Tuple[int, str] = (-1, "")
+
+# Sections de documents formatées, indexées par empreinte du corpus
+_FORMAT_CACHE_MAX_ENTRIES = 16
+_format_cache: "OrderedDict[Tuple[str, str, int, Optional[str]], str]" = OrderedDict()
+_format_cache_lock = threading.Lock()
+
+# Titre précédant chaque document d'une réponse groupée ("## RÉSULTAT 2")
+_RESULT_HEADER_RE = re.compile(r"^##\s*RÉSULTAT\s+(\d+)\s*:?\s*$", re.MULTILINE)
+
+@lru_cache(maxsize=None)
+def _get_encoder(model_name: str):
+    """
+    Retourne le tokenizer tiktoken du modèle (chargé une seule fois).
+    
+    Le premier chargement télécharge le fichier BPE : en cas d'échec (pas de
+    réseau, proxy...), l'échec est mémorisé et les longueurs sont mesurées
+    en caractères.
+    
+    Args:
+        model_name: Nom du modèle
+        
+    Returns:
+        Encodage tiktoken, ou None si tiktoken n'est pas installé ou inutilisable
+    """
+    if tiktoken is None:
+        return None
+    try:
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            return tiktoken.get_encoding("o200k_base")
+    except Exception as e:
+        logger.warning("Tokenizer tiktoken indisponible (%s), budget en caractères", e)
+        return None
+
+def _now_iso() -> str:
+    """
+    Retourne l'horodatage courant au format ISO, à la seconde près.
+    
+    La chaîne n'est formatée qu'une fois par seconde : les prompts construits
+    en rafale partagent la même valeur.
+    
+    Returns:
+        Horodatage ISO 8601 (sans microsecondes)
+    """
+    global _iso_cache
+    second = int(time.time())
+    cached_second, cached_iso = _iso_cache
+    if cached_second != second:
+        cached_iso = datetime.fromtimestamp(second).isoformat()
+        _iso_cache = (second, cached_iso)
+    return cached_iso
+
+def _split_template(template: str) -> List[str]:
+    """
+    Découpe un template une fois pour toutes autour de ses champs {nom}.
+    
+    Args:
+        template: Template au format str.format
+        
+    Returns:
+        Liste alternant texte littéral (indices pairs) et noms de champs (indices impairs)
+    """
+    return re.split(r"\{(\w+)\}", template)
+
+def _render_template(parts: List[str], values: Dict[str, Any]) -> str:
+    """
+    Assemble un template pré-découpé avec les valeurs fournies.
+    
+    Args:
+        parts: Template découpé par _split_template
+        values: Valeur de chaque champ
+        
+    Returns:
+        Texte final
+    """
+    return "".join(str(values[part]) if i % 2 else part for i, part in enumerate(parts))
+
+def _text_length(text: str, encoder) -> int:
+    """
+    Mesure un texte en tokens, ou en caractères sans tokenizer.
+    
+    Args:
+        text: Texte à mesurer
+        encoder: Encodage tiktoken ou None
+        
+    Returns:
+        Longueur du texte
+    """
+    if encoder is None:
+        return len(text)
+    return len(encoder.encode(text, disallowed_special=()))
+
+def _truncate_text(text: str, max_length: int, encoder) -> Tuple[str, bool]:
+    """
+    Tronque un texte à max_length tokens (ou caractères sans tokenizer).
+    
+    La coupe en tokens ne sépare jamais un token en deux. Elle se fait de
+    préférence à la fin d'un paragraphe, pour ne pas briser un tableau ou
+    une liste Markdown, tant que la partie conservée reste proche du budget.
+    
+    Args:
+        text: Texte à tronquer
+        max_length: Longueur maximale
+        encoder: Encodage tiktoken ou None
+        
+    Returns:
+        Tuple (texte éventuellement tronqué, True si tronqué)
+    """
+    if encoder is None:
+        if len(text) <= max_length:
+            return text, False
+        cut = text[:max_length]
+    else:
+        tokens = encoder.encode(text, disallowed_special=())
+        if len(tokens) <= max_length:
+            return text, False
+        # Un caractère multi-octets coupé par le dernier token est décodé en U+FFFD
+        cut = encoder.decode(tokens[:max_length]).rstrip("\ufffd")
+    
+    paragraph_end = cut.rfind("\n\n")
+    if paragraph_end >= len(cut) * _PARAGRAPH_CUT_MIN_RATIO:
+        cut = cut[:paragraph_end]
+    return cut, True
+
+def _docs_digest(docs: Tuple[Tuple[str, Optional[str]], ...]) -> str:
+    """
+    Calcule l'empreinte d'un jeu de documents.
+    
+    Args:
+        docs: Couples (texte, chemin du fichier ou None) des documents
+        
+    Returns:
+        Empreinte hexadécimale
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    for content, file_path in docs:
+        hasher.update(content.encode("utf-8", "surrogatepass"))
+        # Distinguer l'absence de chemin d'un chemin vide
+        if file_path is None:
+            hasher.update(b"\1")
+        else:
+            hasher.update(b"\0")
+            hasher.update(file_path.encode("utf-8", "surrogatepass"))
+        hasher.update(b"\0")
+    return hasher.hexdigest()
+
+def _format_docs(docs: Tuple[Tuple[str, Optional[str]], ...], label: str, max_length: int,
+                 encoder=None) -> str:
+    """
+    Formate une liste de documents pour le prompt (résultat mémorisé).
+    
+    Le même corpus est généralement réutilisé d'une génération à l'autre :
+    seul le premier appel pour un jeu de documents fait le formatage. Le
+    cache est indexé par empreinte, il ne conserve pas les textes complets.
+    
+    Args:
+        docs: Couples (texte, chemin du fichier ou None) des documents
+        label: Libellé des sections ("Source", "Exemple")
+        max_length: Longueur maximale du contenu de chaque document
+        encoder: Encodage tiktoken pour mesurer en tokens, ou None
+        
+    Returns:
+        Contenu formaté des documents
+    """
+    key = (_docs_digest(docs), label, max_length, encoder.name if encoder is not None else None)
+    with _format_cache_lock:
+        formatted = _format_cache.get(key)
+        if formatted is not None:
+            _format_cache.move_to_end(key)
+            return formatted
+    
+    formatted = _build_docs_section(docs, label, max_length, encoder)
+    
+    with _format_cache_lock:
+        _format_cache[key] = formatted
+        _format_cache.move_to_end(key)
+        while len(_format_cache) > _FORMAT_CACHE_MAX_ENTRIES:
+            _format_cache.popitem(last=False)
+    
+    return formatted
+
+def _build_docs_section(docs: Tuple[Tuple[str, Optional[str]], ...], label: str, max_length: int,
+                        encoder=None) -> str:
+    """
+    Formate une liste de documents pour le prompt.
+    
+    Args:
+        docs: Couples (texte, chemin du fichier ou None) des documents
+        label: Libellé des sections ("Source", "Exemple")
+        max_length: Longueur maximale du contenu de chaque document
+        encoder: Encodage tiktoken pour mesurer en tokens, ou None
+        
+    Returns:
+        Contenu formaté des documents
+    """
+    formatted_docs = []
+    
+    for i, (content, file_path) in enumerate(docs, 1):
+        # Fragments assemblés en une seule fois par document
+        parts = ["### ", label, " ", str(i)]
+        
+        if file_path is not None:
+            parts.extend((" (", file_path, ")"))
+        
+        parts.append(":\n")
+        
+        content, truncated = _truncate_text(content, max_length, encoder)
+        parts.append(content)
+        if truncated:
+            parts.append("\n[...contenu tronqué...]")
+        
+        formatted_docs.append("".join(parts))
+    
+    return "\n\n".join(formatted_docs)
+
 class PromptBuilder:
     """
     Classe pour construire des prompts structurés pour la génération de documents.
@@ -12,19 +245,27 @@ class PromptBuilder:
     def __init__(self, 
                  max_context_length: int = 8000,
                  include_metadata: bool = True,
-                 language: str = "français"):
+                 language: str = "français",
+                 model_name: str = "gpt-4o"):
         """
         Initialise le constructeur de prompts.
         
+        Les longueurs sont mesurées en tokens avec le tokenizer du modèle
+        lorsque tiktoken est installé, en caractères sinon.
+        
         Args:
-            max_context_length: Longueur maximale du contexte en caractères
+            max_context_length: Longueur maximale du contexte (tokens ou caractères)
             include_metadata: Inclure les métadonnées dans le prompt
             language: Langue pour les instructions
+            model_name: Modèle dont le tokenizer mesure les prompts
         """
         self.max_context_length = max_context_length
         self.include_metadata = include_metadata
         self.language = language
         
+        self._encoder = _get_encoder(model_name)
+        self.length_unit = "caractères" if self._encoder is None else "tokens"
+        
         self._init_templates()
     
     def _init_templates(self):
@@ -48,6 +289,9 @@ Instructions importantes:
 - Intégrez les instructions utilisateur si fournies
 """
         
+        # Longueur du prompt système, constante pour toutes les constructions
+        self._system_prompt_len = self._length(self.system_prompt)
+        
         self.transformation_prompt_template = """
 ## ANALYSE DE TRANSFORMATION
 
@@ -75,12 +319,46 @@ Le document généré doit :
 - Respecter le format Markdown
 - Intégrer les instructions utilisateur si fournies
 """
+        
+        self.batch_transformation_prompt_template = """
+## ANALYSE DE TRANSFORMATION
+
+### DOCUMENT SOURCE ANCIEN (Référence originale):
+{old_source_content}
+
+### DOCUMENT EXEMPLE CONSTRUIT (Transformation appliquée):
+{example_content}
+
+{new_sources_content}
+
+## INSTRUCTIONS
+
+Analysez comment le Document Source Ancien a été transformé en Document Exemple Construit, puis appliquez cette même transformation à chacun des {batch_count} Nouveaux Documents Sources.
+
+{user_instructions}
+
+## GÉNÉRATION DEMANDÉE:
+Générez un document au format Markdown pour chaque Nouveau Document Source, dans l'ordre, en appliquant la même transformation que celle observée entre le Document Source Ancien et le Document Exemple Construit.
+
+Faites précéder chaque document généré d'une ligne de titre "## RÉSULTAT N", où N est le numéro du Nouveau Document Source correspondant, sans autre texte entre les résultats.
+
+Chaque document généré doit :
+- Suivre le même pattern de transformation
+- Être cohérent et bien structuré
+- Respecter le format Markdown
+- Intégrer les instructions utilisateur si fournies
+"""
+        
+        # Templates pré-découpés : l'assemblage ne réanalyse pas le texte du template
+        self._transformation_parts = _split_template(self.transformation_prompt_template)
+        self._batch_transformation_parts = _split_template(self.batch_transformation_prompt_template)
     
     def build_transformation_prompt(self, 
                                    old_source_documents: List[Dict[str, Any]],
                                    example_documents: List[Dict[str, Any]],
                                    new_source_documents: List[Dict[str, Any]],
-                                   user_description: Optional[str] = None) -> Dict[str, Any]:
+                                   user_description: Optional[str] = None,
+                                   emit_metadata: bool = True) -> Dict[str, Any]:
         """
         Construit un prompt pour la transformation 3+1.
         
@@ -89,63 +367,192 @@ Le document généré doit :
             example_documents: Documents exemples construits (transformation)
             new_source_documents: Nouveaux documents sources (à traiter)
             user_description: Description optionnelle de l'utilisateur
+            emit_metadata: Construire les métadonnées du prompt (None sinon)
             
         Returns:
             Dictionnaire contenant le prompt et les métadonnées
         """
-        try:
-            # Préparer le contenu des 3 types de documents
-            old_source_content = self._prepare_source_content(old_source_documents)
-            example_content = self._prepare_example_content(example_documents)
-            new_source_content = self._prepare_source_content(new_source_documents)
-            
-            # Préparer les instructions utilisateur
-            user_instructions = ""
-            if user_description and user_description.strip():
-                user_instructions = f"### INSTRUCTIONS UTILISATEUR:\n{user_description.strip()}\n"
-            
-            # Construire le prompt utilisateur
-            user_prompt = self.transformation_prompt_template.format(
-                old_source_content=old_source_content,
-                example_content=example_content,
-                new_source_content=new_source_content,
-                user_instructions=user_instructions
+        # Préparer le contenu des 3 types de documents
+        old_source_content = self._prepare_source_content(old_source_documents)
+        example_content = self._prepare_example_content(example_documents)
+        new_source_content = self._prepare_source_content(new_source_documents)
+        
+        # Préparer les instructions utilisateur
+        user_instructions = ""
+        if user_description and user_description.strip():
+            user_instructions = f"### INSTRUCTIONS UTILISATEUR:\n{user_description.strip()}\n"
+        
+        # Construire le prompt utilisateur
+        user_prompt = _render_template(self._transformation_parts, {
+            "old_source_content": old_source_content,
+            "example_content": example_content,
+            "new_source_content": new_source_content,
+            "user_instructions": user_instructions
+        })
+        
+        # Vérifier la longueur du prompt
+        total_length = self._system_prompt_len + self._length(user_prompt)
+        truncated = total_length > self.max_context_length
+        
+        if truncated:
+            logger.warning("Prompt trop long (%d %s), troncature nécessaire", total_length, self.length_unit)
+            user_prompt = self._truncate_transformation_prompt(
+                user_prompt, old_source_content, example_content, new_source_content,
+                prompt_length=total_length - self._system_prompt_len
             )
-            
-            # Vérifier la longueur du prompt
-            total_length = len(self.system_prompt) + len(user_prompt)
-            
-            if total_length > self.max_context_length:
-                logger.warning(f"Prompt trop long ({total_length} caractères), troncature nécessaire")
-                user_prompt = self._truncate_transformation_prompt(
-                    user_prompt, old_source_content, example_content, new_source_content
-                )
-            
-            # Métadonnées du prompt
-            prompt_metadata = {
-                "total_length": len(self.system_prompt) + len(user_prompt),
-                "system_prompt_length": len(self.system_prompt),
-                "user_prompt_length": len(user_prompt),
-                "old_source_documents_count": len(old_source_documents),
-                "example_documents_count": len(example_documents),
-                "new_source_documents_count": len(new_source_documents),
-                "created_at": datetime.now().isoformat(),
-                "language": self.language,
-                "truncated": total_length > self.max_context_length,
-                "user_description": user_description
-            }
-            
-            logger.info(f"Prompt construit: {prompt_metadata['total_length']} caractères, {prompt_metadata['old_source_documents_count']} anciennes sources, {prompt_metadata['example_documents_count']} exemples, {prompt_metadata['new_source_documents_count']} nouvelles sources")
-            
+        
+        if not emit_metadata:
             return {
                 "system_prompt": self.system_prompt,
                 "user_prompt": user_prompt,
-                "metadata": prompt_metadata
+                "metadata": None
             }
+        
+        # Métadonnées du prompt
+        user_prompt_length = self._length(user_prompt) if truncated else total_length - self._system_prompt_len
+        prompt_metadata = {
+            "total_length": self._system_prompt_len + user_prompt_length,
+            "system_prompt_length": self._system_prompt_len,
+            "user_prompt_length": user_prompt_length,
+            "length_unit": self.length_unit,
+            "old_source_documents_count": len(old_source_documents),
+            "example_documents_count": len(example_documents),
+            "new_source_documents_count": len(new_source_documents),
+            "created_at": _now_iso(),
+            "language": self.language,
+            "truncated": truncated,
+            "user_description": user_description
+        }
+        
+        logger.info("Prompt construit: %d %s, %d anciennes sources, %d exemples, %d nouvelles sources",
+                    prompt_metadata['total_length'], self.length_unit,
+                    prompt_metadata['old_source_documents_count'],
+                    prompt_metadata['example_documents_count'],
+                    prompt_metadata['new_source_documents_count'])
+        
+        return {
+            "system_prompt": self.system_prompt,
+            "user_prompt": user_prompt,
+            "metadata": prompt_metadata
+        }
+    
+    def build_transformation_prompt_batch(self,
+                                         old_source_documents: List[Dict[str, Any]],
+                                         example_documents: List[Dict[str, Any]],
+                                         new_source_batches: List[List[Dict[str, Any]]],
+                                         user_description: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Construit un seul prompt appliquant la transformation à plusieurs nouvelles sources.
+        
+        Les documents anciens et exemples, communs à toutes les générations,
+        ne sont envoyés qu'une fois. La réponse se découpe avec
+        split_batch_response.
+        
+        Args:
+            old_source_documents: Documents sources anciens (référence)
+            example_documents: Documents exemples construits (transformation)
+            new_source_batches: Nouveaux documents sources, un groupe par document à générer
+            user_description: Description optionnelle de l'utilisateur
+            
+        Returns:
+            Dictionnaire contenant le prompt et les métadonnées
+        """
+        old_source_content = self._prepare_source_content(old_source_documents)
+        example_content = self._prepare_example_content(example_documents)
+        new_contents = [self._prepare_source_content(batch) for batch in new_source_batches]
+        
+        user_instructions = ""
+        if user_description and user_description.strip():
+            user_instructions = f"### INSTRUCTIONS UTILISATEUR:\n{user_description.strip()}\n"
+        
+        user_prompt = self._format_batch_prompt(old_source_content, example_content, new_contents, user_instructions)
+        total_length = self._system_prompt_len + self._length(user_prompt)
+        truncated = total_length > self.max_context_length
+        
+        if truncated:
+            logger.warning("Prompt groupé trop long (%d %s), troncature nécessaire", total_length, self.length_unit)
+            
+            # Réduire proportionnellement tous les contenus
+            content_space = self.max_context_length - self._system_prompt_len - 500 - 1000
+            contents = self._truncate_proportionally(
+                [old_source_content, example_content, *new_contents], content_space
+            )
+            if contents is not None:
+                user_prompt = self._format_batch_prompt(contents[0], contents[1], contents[2:], user_instructions)
+        
+        user_prompt_length = self._length(user_prompt)
+        prompt_metadata = {
+            "total_length": self._system_prompt_len + user_prompt_length,
+            "system_prompt_length": self._system_prompt_len,
+            "user_prompt_length": user_prompt_length,
+            "length_unit": self.length_unit,
+            "old_source_documents_count": len(old_source_documents),
+            "example_documents_count": len(example_documents),
+            "new_source_documents_count": sum(len(batch) for batch in new_source_batches),
+            "batch_count": len(new_source_batches),
+            "created_at": _now_iso(),
+            "language": self.language,
+            "truncated": truncated,
+            "user_description": user_description
+        }
+        
+        logger.info("Prompt groupé construit: %d %s, %d documents à générer",
+                    prompt_metadata['total_length'], self.length_unit, prompt_metadata['batch_count'])
+        
+        return {
+            "system_prompt": self.system_prompt,
+            "user_prompt": user_prompt,
+            "metadata": prompt_metadata
+        }
+    
+    def _format_batch_prompt(self, old_source_content: str, example_content: str,
+                             new_contents: List[str], user_instructions: str) -> str:
+        """
+        Remplit le template du prompt groupé.
+        
+        Args:
+            old_source_content: Contenu des sources anciennes
+            example_content: Contenu des exemples
+            new_contents: Contenu de chaque groupe de nouvelles sources
+            user_instructions: Instructions utilisateur formatées
+            
+        Returns:
+            Prompt utilisateur
+        """
+        new_sources_content = "\n\n".join(
+            f"### NOUVEAU DOCUMENT SOURCE {j} (À transformer):\n{content}"
+            for j, content in enumerate(new_contents, 1)
+        )
+        return _render_template(self._batch_transformation_parts, {
+            "old_source_content": old_source_content,
+            "example_content": example_content,
+            "new_sources_content": new_sources_content,
+            "batch_count": len(new_contents),
+            "user_instructions": user_instructions
+        })
+    
+    @staticmethod
+    def split_batch_response(content: str, batch_count: int) -> List[str]:
+        """
+        Découpe la réponse à un prompt groupé en documents individuels.
+        
+        Args:
+            content: Réponse du modèle
+            batch_count: Nombre de documents attendus
             
-        except Exception as e:
-            logger.error(f"Erreur lors de la construction du prompt de transformation: {str(e)}")
-            raise
+        Returns:
+            Liste des documents, dans l'ordre (chaîne vide si un résultat manque)
+        """
+        results = [""] * batch_count
+        headers = list(_RESULT_HEADER_RE.finditer(content))
+        
+        for k, header in enumerate(headers):
+            index = int(header.group(1)) - 1
+            if 0 <= index < batch_count:
+                end = headers[k + 1].start() if k + 1 < len(headers) else len(content)
+                results[index] = content[header.end():end].strip()
+        
+        return results
     
     def _prepare_source_content(self, source_documents: List[Dict[str, Any]]) -> str:
         """
@@ -160,28 +567,10 @@ Le document généré doit :
         if not source_documents:
             return "Aucun document source fourni."
         
-        formatted_sources = []
+        # Limiter la longueur de chaque source
+        max_source_length = self.max_context_length // (len(source_documents) * 2)
         
-        for i, doc in enumerate(source_documents, 1):
-            content = doc.get('text', '')
-            metadata = doc.get('metadata', {})
-            
-            source_header = f"### Source {i}"
-            
-            if self.include_metadata and metadata:
-                file_path = metadata.get('file_path', 'Inconnu')
-                source_header += f" ({file_path})"
-            
-            source_header += ":\n"
-            
-            # Limiter la longueur de chaque source
-            max_source_length = self.max_context_length // (len(source_documents) * 2)
-            if len(content) > max_source_length:
-                content = content[:max_source_length] + "\n[...contenu tronqué...]"
-            
-            formatted_sources.append(source_header + content)
-        
-        return "\n\n".join(formatted_sources)
+        return _format_docs(self._docs_key(source_documents), "Source", max_source_length, self._encoder)
     
     def _prepare_example_content(self, example_documents: List[Dict[str, Any]]) -> str:
         """
@@ -196,31 +585,43 @@ Le document généré doit :
         if not example_documents:
             return "Aucun document exemple fourni."
         
-        formatted_examples = []
+        # Limiter la longueur de chaque exemple
+        max_example_length = self.max_context_length // (len(example_documents) * 3)
         
-        for i, doc in enumerate(example_documents, 1):
-            content = doc.get('text', '')
-            metadata = doc.get('metadata', {})
-            
-            example_header = f"### Exemple {i}"
-            
-            if self.include_metadata and metadata:
-                file_path = metadata.get('file_path', 'Inconnu')
-                example_header += f" ({file_path})"
-            
-            example_header += ":\n"
-            
-            # Limiter la longueur de chaque exemple
-            max_example_length = self.max_context_length // (len(example_documents) * 3)
-            if len(content) > max_example_length:
-                content = content[:max_example_length] + "\n[...contenu tronqué...]"
+        return _format_docs(self._docs_key(example_documents), "Exemple", max_example_length, self._encoder)
+    
+    def _length(self, text: str) -> int:
+        """
+        Mesure un texte dans l'unité du budget de contexte.
+        
+        Args:
+            text: Texte à mesurer
             
-            formatted_examples.append(example_header + content)
+        Returns:
+            Longueur en tokens (ou en caractères sans tiktoken)
+        """
+        return _text_length(text, self._encoder)
+    
+    def _docs_key(self, documents: List[Dict[str, Any]]) -> Tuple[Tuple[str, Optional[str]], ...]:
+        """
+        Réduit une liste de documents aux éléments utilisés par le formatage.
         
-        return "\n\n".join(formatted_examples)
+        Args:
+            documents: Liste des documents
+            
+        Returns:
+            Couples (texte, chemin du fichier ou None) hachables
+        """
+        key = []
+        for doc in documents:
+            metadata = doc.get('metadata', {})
+            file_path = metadata.get('file_path', 'Inconnu') if self.include_metadata and metadata else None
+            key.append((doc.get('text', ''), file_path))
+        return tuple(key)
     
     def _truncate_transformation_prompt(self, user_prompt: str, old_source_content: str, 
-                                       example_content: str, new_source_content: str) -> str:
+                                       example_content: str, new_source_content: str,
+                                       prompt_length: Optional[int] = None) -> str:
         """
         Tronque le prompt de transformation si nécessaire.
         
@@ -229,52 +630,81 @@ Le document généré doit :
             old_source_content: Contenu des sources anciennes
             example_content: Contenu des exemples
             new_source_content: Contenu des nouvelles sources
+            prompt_length: Longueur déjà mesurée du prompt utilisateur
             
         Returns:
             Prompt tronqué
         """
-        try:
-            # Calculer l'espace disponible
-            available_space = self.max_context_length - len(self.system_prompt) - 500
-            
-            if len(user_prompt) <= available_space:
-                return user_prompt
-            
-            # Stratégie de troncature: réduire proportionnellement les 3 contenus
-            total_content = len(old_source_content) + len(example_content) + len(new_source_content)
-            
-            if total_content == 0:
-                return user_prompt[:available_space]
-            
-            old_ratio = len(old_source_content) / total_content
-            example_ratio = len(example_content) / total_content
-            new_ratio = len(new_source_content) / total_content
-            
-            # Calculer les nouvelles tailles
-            content_space = available_space - 1000  # Espace pour le template
-            new_old_length = int(content_space * old_ratio)
-            new_example_length = int(content_space * example_ratio)
-            new_new_length = int(content_space * new_ratio)
-            
-            # Tronquer les contenus
-            truncated_old = old_source_content[:new_old_length] + "\n[...tronqué...]" if len(old_source_content) > new_old_length else old_source_content
-            truncated_example = example_content[:new_example_length] + "\n[...tronqué...]" if len(example_content) > new_example_length else example_content
-            truncated_new = new_source_content[:new_new_length] + "\n[...tronqué...]" if len(new_source_content) > new_new_length else new_source_content
-            
-            # Reconstruire le prompt avec le contenu tronqué
-            truncated_prompt = self.transformation_prompt_template.format(
-                old_source_content=truncated_old,
-                example_content=truncated_example,
-                new_source_content=truncated_new,
-                user_instructions=""
-            )
+        # Calculer l'espace disponible
+        available_space = self.max_context_length - self._system_prompt_len - 500
+        
+        if prompt_length is None:
+            prompt_length = self._length(user_prompt)
+        if prompt_length <= available_space:
+            return user_prompt
+        
+        # Stratégie de troncature: réduire proportionnellement les 3 contenus
+        content_space = available_space - 1000  # Espace pour le template
+        truncated_contents = self._truncate_proportionally(
+            [old_source_content, example_content, new_source_content], content_space
+        )
+        
+        if truncated_contents is None:
+            return _truncate_text(user_prompt, available_space, self._encoder)[0]
+        
+        truncated_old, truncated_example, truncated_new = truncated_contents
+        
+        # Reconstruire le prompt avec le contenu tronqué
+        truncated_prompt = _render_template(self._transformation_parts, {
+            "old_source_content": truncated_old,
+            "example_content": truncated_example,
+            "new_source_content": truncated_new,
+            "user_instructions": ""
+        })
+        
+        # La mesure du prompt tronqué (un encodage complet avec tiktoken) ne sert qu'au log
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Prompt tronqué de %d à %d %s", prompt_length, self._length(truncated_prompt), self.length_unit)
+        return truncated_prompt
+    
+    def _truncate_proportionally(self, contents: List[str], content_space: int) -> Optional[List[str]]:
+        """
+        Répartit l'espace disponible entre des contenus, au prorata de leur longueur.
+        
+        Chaque longueur n'est mesurée qu'une fois ; le facteur d'échelle est
+        commun à tous les contenus.
+        
+        Args:
+            contents: Contenus à réduire
+            content_space: Espace total disponible pour les contenus
             
-            logger.info(f"Prompt tronqué de {len(user_prompt)} à {len(truncated_prompt)} caractères")
-            return truncated_prompt
+        Returns:
+            Contenus tronqués, ou None s'ils sont tous vides
+        """
+        lengths = [self._length(content) for content in contents]
+        total_content = sum(lengths)
+        
+        if total_content == 0:
+            return None
+        
+        return [
+            self._truncate_content(content, int(content_space * (length / total_content)))
+            for content, length in zip(contents, lengths)
+        ]
+    
+    def _truncate_content(self, content: str, max_length: int) -> str:
+        """
+        Tronque un contenu du prompt en signalant la coupure.
+        
+        Args:
+            content: Contenu à tronquer
+            max_length: Longueur maximale
             
-        except Exception as e:
-            logger.error(f"Erreur lors de la troncature: {str(e)}")
-            return user_prompt[:available_space]
+        Returns:
+            Contenu, suivi d'une marque de troncature s'il a été coupé
+        """
+        content, truncated = _truncate_text(content, max_length, self._encoder)
+        return content + "\n[...tronqué...]" if truncated else content
     
     def build_simple_prompt(self, content: str, task: str) -> Dict[str, Any]:
         """
@@ -304,7 +734,7 @@ Veuillez traiter ce contenu selon la tâche demandée.
             "metadata": {
                 "total_length": len(simple_system) + len(simple_user),
                 "type": "simple",
-                "created_at": datetime.now().isoformat()
+                "created_at": _now_iso()
             }
         }
     
@@ -322,15 +752,17 @@ Veuillez traiter ce contenu selon la tâche demandée.
         
         for key in required_keys:
             if key not in prompt_data:
-                logger.error(f"Clé manquante dans le prompt: {key}")
+                logger.error("Clé manquante dans le prompt: %s", key)
                 return False
         
         if not prompt_data['system_prompt'] or not prompt_data['user_prompt']:
             logger.error("Prompt système ou utilisateur vide")
             return False
         
-        total_length = prompt_data['metadata'].get('total_length', 0)
+        # Métadonnées absentes si le prompt a été construit sans (emit_metadata=False)
+        metadata = prompt_data['metadata'] or {}
+        total_length = metadata.get('total_length', 0)
         if total_length > self.max_context_length:
-            logger.warning(f"Prompt très long: {total_length} caractères")
+            logger.warning("Prompt très long: %d %s", total_length, self.length_unit)
         
         return True
\ No newline at end of file
@@ -1,9 +1,101 @@
 import re
+import string
 import logging
 from typing import Dict, Any, List, Optional
 
+# Moteur regex à temps linéaire (optionnel) pour l'alternance fusionnée
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 logger = logging.getLogger(__name__)
 
+# Sauts de page et caractères de contrôle
+_PAGE_BREAK_RE = re.compile(r'\f|\x0c')
+
+# Espaces multiples (mais préserver les sauts de ligne) ; un espace isolé
+# n'est pas capturé, le texte n'est ainsi recopié que s'il change
+_MULTIPLE_SPACES_RE = re.compile(r'[ \t]{2,}|\t')
+
+# Lignes vides multiples
+_MULTIPLE_NEWLINES_RE = re.compile(r'\n\s*\n\s*\n+')
+
+# Caractères spéciaux inutiles (mais préserver la ponctuation normale)
+_SPECIAL_CHARS_RE = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
+
+# Métadonnées communes dans les PDFs
+_METADATA_RES = (
+    re.compile(r'Page \d+ of \d+', re.IGNORECASE),
+    re.compile(r'\d+/\d+', re.IGNORECASE),
+    re.compile(r'Printed on .*', re.IGNORECASE),
+    re.compile(r'Generated on .*', re.IGNORECASE),
+    re.compile(r'Copyright ©.*', re.IGNORECASE),
+    re.compile(r'\[Page \d+\]', re.IGNORECASE)
+)
+# Sous-chaînes dont l'une doit figurer dans le texte pour que le motif de
+# métadonnées correspondant puisse s'appliquer : variantes de casse usuelles
+# (minuscules, capitale initiale, majuscules), testées sur le texte d'origine
+# sans en créer de copie en minuscules
+_METADATA_PROBES = (
+    ('page ', 'Page ', 'PAGE '),
+    ('/',),
+    ('nted on ', 'nted On ', 'NTED ON '),
+    ('generated on ', 'Generated on ', 'Generated On ', 'GENERATED ON '),
+    ('©',),
+    ('[page ', '[Page ', '[PAGE ')
+)
+
+# Espaces en début et fin de ligne, lignes vides ou d'un seul caractère non alphanumérique
+_LINE_EDGES_RE = re.compile(r'[^\S\n]*\n[^\S\n]*')
+# (lignes en tête avec leur saut de ligne, les suivantes avec le saut de ligne qui les précède)
+_ARTEFACT_LINE_RE = re.compile(r'\A(?:(?:[^\w\s]|_)?(?:\n|\Z))+|\n(?:[^\w\s]|_)?(?=\n|\Z)')
+
+# Patterns pour préserver la structure
+_TITLE_RE = re.compile(r'^([A-Z][A-Z\s]{2,})$', re.MULTILINE)
+_BULLET_RE = re.compile(r'^\s*[•·▪▫◦‣⁃]\s+', re.MULTILINE)
+_NUMBER_LIST_RE = re.compile(r'^\s*\d+[.):]\s+', re.MULTILINE)
+_HEADER_RE = re.compile(r'^#+\s+', re.MULTILINE)
+
+# Table supprimant les majuscules ASCII : une ligne est un titre si, après
+# suppression, il ne reste que des espaces (équivalent de _TITLE_RE)
+_UPPERCASE_DELETION = str.maketrans('', '', string.ascii_uppercase)
+
+# Optimisations supplémentaires pour LLM
+_EXCESS_NEWLINES_RE = re.compile(r'\n{3,}')
+_SENTENCE_RUN_ON_RE = re.compile(r'([.!?])([A-Z])')
+
+# Configuration optimisée pour LLM
+_LLM_CONFIG = {
+    'remove_extra_whitespace': True,
+    'remove_special_chars': True,
+    'remove_page_breaks': True,
+    'remove_metadata': True,
+    'preserve_structure': True
+}
+
+def _compile_combined(pattern: str):
+    """
+    Compile l'alternance fusionnée, avec RE2 si disponible, sinon avec re.
+    
+    RE2 parcourt chaque caractère une seule fois (automate, sans retour
+    arrière), ce qui accélère nettement le balayage des textes sans
+    métadonnées.
+    
+    Args:
+        pattern: Source de l'alternance
+        
+    Returns:
+        Pattern compilé (re2 ou re)
+    """
+    if re2 is not None:
+        try:
+            # \d de re couvre tous les chiffres Unicode, comme \p{Nd} pour RE2
+            return re2.compile(pattern.replace(r'\d', r'\p{Nd}'))
+        except re2.error as e:
+            logger.debug("Pattern non compilable avec RE2, repli sur re: %s", e)
+    return re.compile(pattern)
+
 class TextCleaner:
     """
     Classe pour nettoyer et préprocesser le texte extrait des documents.
@@ -36,43 +128,36 @@ class TextCleaner:
     
     def _init_patterns(self):
         """
-        Initialise les patterns regex pour le nettoyage.
+        Initialise les patterns regex pour le nettoyage (compilés une seule fois au niveau du module).
         """
-        # Sauts de page et caractères de contrôle
-        self.page_break_pattern = re.compile(r'\f|\x0c')
-        
-        # Espaces multiples (mais préserver les sauts de ligne)
-        self.multiple_spaces_pattern = re.compile(r'[ \t]+')
-        
-        # Lignes vides multiples
-        self.multiple_newlines_pattern = re.compile(r'\n\s*\n\s*\n+')
-        
-        # Caractères spéciaux inutiles (mais préserver la ponctuation normale)
-        self.special_chars_pattern = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f\x7f-\x9f]')
-        
-        # Métadonnées communes dans les PDFs
-        self.metadata_patterns = [
-            re.compile(r'Page \d+ of \d+', re.IGNORECASE),
-            re.compile(r'\d+/\d+', re.IGNORECASE),
-            re.compile(r'Printed on .*', re.IGNORECASE),
-            re.compile(r'Generated on .*', re.IGNORECASE),
-            re.compile(r'Copyright ©.*', re.IGNORECASE),
-            re.compile(r'\[Page \d+\]', re.IGNORECASE)
-        ]
-        
-        # Patterns pour préserver la structure
-        self.title_pattern = re.compile(r'^([A-Z][A-Z\s]{2,})$', re.MULTILINE)
-        self.bullet_pattern = re.compile(r'^\s*[•·▪▫◦‣⁃]\s+', re.MULTILINE)
-        self.number_list_pattern = re.compile(r'^\s*\d+[.):]\s+', re.MULTILINE)
-        self.header_pattern = re.compile(r'^#+\s+', re.MULTILINE)
+        self.page_break_pattern = _PAGE_BREAK_RE
+        self.multiple_spaces_pattern = _MULTIPLE_SPACES_RE
+        self.multiple_newlines_pattern = _MULTIPLE_NEWLINES_RE
+        self.special_chars_pattern = _SPECIAL_CHARS_RE
+        self.metadata_patterns = list(_METADATA_RES)
+        self.metadata_probes = list(_METADATA_PROBES)
+        self.line_edges_pattern = _LINE_EDGES_RE
+        self.artefact_line_pattern = _ARTEFACT_LINE_RE
+        
+        # Alternances fusionnées des étapes 1 à 3, par combinaison de motifs
+        self._combined_patterns: Dict[tuple, Optional[re.Pattern]] = {}
+        
+        self.title_pattern = _TITLE_RE
+        self.bullet_pattern = _BULLET_RE
+        self.number_list_pattern = _NUMBER_LIST_RE
+        self.header_pattern = _HEADER_RE
+        self.excess_newlines_pattern = _EXCESS_NEWLINES_RE
+        self.sentence_run_on_pattern = _SENTENCE_RUN_ON_RE
     
-    def clean(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    def clean(self, text: str, metadata: Optional[Dict[str, Any]] = None,
+              config: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
         """
         Nettoie le texte selon les paramètres configurés.
         
         Args:
             text: Texte à nettoyer
             metadata: Métadonnées optionnelles du document
+            config: Options remplaçant celles de l'instance pour cet appel uniquement
             
         Returns:
             Dictionnaire avec le texte nettoyé et les statistiques
@@ -88,37 +173,50 @@ class TextCleaner:
                 }
             }
         
+        options = {
+            'remove_extra_whitespace': self.remove_extra_whitespace,
+            'remove_special_chars': self.remove_special_chars,
+            'remove_page_breaks': self.remove_page_breaks,
+            'remove_metadata': self.remove_metadata,
+            'preserve_structure': self.preserve_structure
+        }
+        if config:
+            options.update(config)
+        
         original_length = len(text)
         cleaned_text = text
         cleaning_steps = []
         
-        # Étape 1: Supprimer les sauts de page
-        if self.remove_page_breaks:
-            before_length = len(cleaned_text)
-            cleaned_text = self.page_break_pattern.sub('\n', cleaned_text)
-            removed = before_length - len(cleaned_text)
-            if removed > 0:
-                cleaning_steps.append(f"Sauts de page supprimés: {removed} caractères")
-        
-        # Étape 2: Supprimer les caractères de contrôle
-        if self.remove_special_chars:
-            before_length = len(cleaned_text)
-            cleaned_text = self.special_chars_pattern.sub('', cleaned_text)
-            removed = before_length - len(cleaned_text)
-            if removed > 0:
-                cleaning_steps.append(f"Caractères spéciaux supprimés: {removed} caractères")
-        
-        # Étape 3: Supprimer les métadonnées
-        if self.remove_metadata:
-            before_length = len(cleaned_text)
-            for pattern in self.metadata_patterns:
-                cleaned_text = pattern.sub('', cleaned_text)
-            removed = before_length - len(cleaned_text)
-            if removed > 0:
-                cleaning_steps.append(f"Métadonnées supprimées: {removed} caractères")
+        # Étapes 1 à 3 en un seul passage : sauts de page remplacés par un
+        # saut de ligne, caractères de contrôle et métadonnées supprimés
+        combined_pattern = self._combined_pattern(
+            cleaned_text,
+            options['remove_page_breaks'],
+            options['remove_special_chars'],
+            options['remove_metadata']
+        )
+        if combined_pattern is not None:
+            removed = {'special': 0, 'metadata': 0}
+            
+            def replace(match: re.Match) -> str:
+                group = match.lastgroup
+                if group == 'page_break':
+                    return '\n'
+                if group == 'special':
+                    removed['special'] += 1
+                else:
+                    removed['metadata'] += match.end() - match.start()
+                return ''
+            
+            cleaned_text = combined_pattern.sub(replace, cleaned_text)
+            
+            if removed['special'] > 0:
+                cleaning_steps.append(f"Caractères spéciaux supprimés: {removed['special']} caractères")
+            if removed['metadata'] > 0:
+                cleaning_steps.append(f"Métadonnées supprimées: {removed['metadata']} caractères")
         
         # Étape 4: Normaliser les espaces
-        if self.remove_extra_whitespace:
+        if options['remove_extra_whitespace']:
             before_length = len(cleaned_text)
             # Remplacer les espaces multiples par un seul espace
             cleaned_text = self.multiple_spaces_pattern.sub(' ', cleaned_text)
@@ -129,23 +227,13 @@ class TextCleaner:
                 cleaning_steps.append(f"Espaces normalisés: {removed} caractères")
         
         # Étape 5: Nettoyer les débuts et fins de lignes
-        lines = cleaned_text.split('\n')
-        cleaned_lines = []
-        
-        for line in lines:
-            # Supprimer les espaces en début et fin de ligne
-            line = line.strip()
-            
-            # Ignorer les lignes très courtes qui sont probablement des artefacts
-            if len(line) < 2 and not line.isalnum():
-                continue
-                
-            cleaned_lines.append(line)
-        
-        cleaned_text = '\n'.join(cleaned_lines)
+        # Supprimer les espaces en début et fin de ligne
+        cleaned_text = self.line_edges_pattern.sub('\n', cleaned_text.strip())
+        # Ignorer les lignes très courtes qui sont probablement des artefacts
+        cleaned_text = self.artefact_line_pattern.sub('', cleaned_text)
         
         # Étape 6: Préserver la structure si demandé
-        if self.preserve_structure:
+        if options['preserve_structure']:
             cleaned_text = self._preserve_structure(cleaned_text)
             cleaning_steps.append("Structure préservée")
         
@@ -168,6 +256,57 @@ class TextCleaner:
             "cleaning_stats": cleaning_stats
         }
     
+    def _combined_pattern(self, text: str, remove_page_breaks: bool,
+                          remove_special_chars: bool, remove_metadata: bool) -> Optional[re.Pattern]:
+        """
+        Retourne l'alternance regex fusionnant les étapes 1 à 3 utiles pour ce texte.
+        
+        Chaque motif est un groupe nommé ; l'ordre des alternatives reproduit
+        l'ordre des étapes (sauts de page, caractères de contrôle, métadonnées).
+        Des tests peu coûteux écartent au préalable les motifs qui ne peuvent
+        pas correspondre, ce qui évite le plus souvent le passage regex.
+        
+        Args:
+            text: Texte à nettoyer
+            remove_page_breaks: Remplacer les sauts de page
+            remove_special_chars: Supprimer les caractères de contrôle
+            remove_metadata: Supprimer les métadonnées
+            
+        Returns:
+            Pattern compilé, ou None si aucun motif ne peut correspondre
+        """
+        page_breaks = remove_page_breaks and '\f' in text
+        special_chars = (
+            remove_special_chars
+            and self.special_chars_pattern.search(text) is not None
+        )
+        metadata_indexes = ()
+        if remove_metadata:
+            metadata_indexes = tuple(
+                i for i, variants in enumerate(self.metadata_probes)
+                if any(variant in text for variant in variants)
+            )
+        
+        key = (page_breaks, special_chars, metadata_indexes)
+        if key in self._combined_patterns:
+            return self._combined_patterns[key]
+        
+        alternatives = []
+        if page_breaks:
+            alternatives.append(f"(?P<page_break>{self.page_break_pattern.pattern})")
+        if special_chars:
+            alternatives.append(f"(?P<special>{self.special_chars_pattern.pattern})")
+        for i in metadata_indexes:
+            metadata_pattern = self.metadata_patterns[i].pattern
+            if page_breaks:
+                # Les sauts de page sont devenus des fins de ligne avant l'étape 3
+                metadata_pattern = metadata_pattern.replace('.*', '[^\\n\\f]*')
+            alternatives.append(f"(?P<metadata{i}>(?i:{metadata_pattern}))")
+        
+        combined_pattern = _compile_combined('|'.join(alternatives)) if alternatives else None
+        self._combined_patterns[key] = combined_pattern
+        return combined_pattern
+    
     def _preserve_structure(self, text: str) -> str:
         """
         Préserve et améliore la structure du texte.
@@ -181,27 +320,20 @@ class TextCleaner:
         lines = text.split('\n')
         structured_lines = []
         
-        for i, line in enumerate(lines):
-            if not line.strip():
-                structured_lines.append(line)
-                continue
-            
-            # Détecter les titres (lignes en majuscules)
-            if self.title_pattern.match(line) and len(line) > 5:
+        for line in lines:
+            # Détecter les titres (lignes en majuscules) : test du premier caractère,
+            # puis vérification du reste de la ligne sans passer par le moteur regex
+            if (len(line) > 5 and 'A' <= line[0] <= 'Z'
+                    and not line.translate(_UPPERCASE_DELETION).strip()):
                 # Ajouter une ligne vide avant le titre si nécessaire
-                if i > 0 and structured_lines and structured_lines[-1].strip():
+                if structured_lines and structured_lines[-1].strip():
                     structured_lines.append('')
                 structured_lines.append(line)
                 # Ajouter une ligne vide après le titre
                 structured_lines.append('')
                 continue
             
-            # Détecter les listes à puces
-            if self.bullet_pattern.match(line) or self.number_list_pattern.match(line):
-                structured_lines.append(line)
-                continue
-            
-            # Ligne normale
+            # Lignes vides, listes et lignes normales sont conservées telles quelles
             structured_lines.append(line)
         
         return '\n'.join(structured_lines)
@@ -216,34 +348,15 @@ class TextCleaner:
         Returns:
             Texte optimisé pour LLM
         """
-        # Configuration spéciale pour LLM
-        original_config = {
-            'remove_extra_whitespace': self.remove_extra_whitespace,
-            'remove_special_chars': self.remove_special_chars,
-            'remove_page_breaks': self.remove_page_breaks,
-            'remove_metadata': self.remove_metadata,
-            'preserve_structure': self.preserve_structure
-        }
-        
-        # Configuration optimisée pour LLM
-        self.remove_extra_whitespace = True
-        self.remove_special_chars = True
-        self.remove_page_breaks = True
-        self.remove_metadata = True
-        self.preserve_structure = True
-        
-        result = self.clean(text)
+        # Configuration optimisée pour LLM, sans modifier celle de l'instance
+        result = self.clean(text, config=_LLM_CONFIG)
         cleaned_text = result['cleaned_text']
         
         # Optimisations supplémentaires pour LLM
         # Limiter les lignes vides consécutives
-        cleaned_text = re.sub(r'\n{3,}', '\n\n', cleaned_text)
+        cleaned_text = self.excess_newlines_pattern.sub('\n\n', cleaned_text)
         
         # S'assurer que les phrases se terminent correctement
-        cleaned_text = re.sub(r'([.!?])([A-Z])', r'\1 \2', cleaned_text)
-        
-        # Restaurer la configuration originale
-        for key, value in original_config.items():
-            setattr(self, key, value)
+        cleaned_text = self.sentence_run_on_pattern.sub(r'\1 \2', cleaned_text)
         
         return cleaned_text
\ No newline at end of file
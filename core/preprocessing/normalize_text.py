@@ -1,10 +1,88 @@
 import re
+import sys
 import unicodedata
 import logging
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Guillemets et apostrophes
+_QUOTES_RE = re.compile(r'[`´]')
+_DOUBLE_QUOTES_RE = re.compile(r'[«»]')
+
+# Tirets et traits d'union
+_DASHES_RE = re.compile(r'[–—―]')
+
+# Espaces spéciaux
+_SPECIAL_SPACES_RE = re.compile(r'[\u00A0\u2000-\u200B\u2028\u2029\u202F\u205F\u3000]')
+
+# Points de suspension
+_ELLIPSIS_RE = re.compile(r'…')
+
+# Étapes 3 à 5 et points de suspension en une seule table de traduction,
+# avec le pattern permettant de retrouver le message de chaque étape
+_CHARACTERS_TABLE = str.maketrans({
+    **dict.fromkeys('\u00A0\u2028\u2029\u202F\u205F\u3000', ' '),
+    **dict.fromkeys(map(chr, range(0x2000, 0x200C)), ' '),
+    '`': "'", '´': "'", '«': '"', '»': '"',
+    '–': '-', '—': '-', '―': '-',
+    '…': '...'
+})
+_CHARACTERS_STEPS = (
+    ("Espaces spéciaux normalisés", _SPECIAL_SPACES_RE),
+    ("Guillemets normalisés", re.compile(r'[`´«»]')),
+    ("Tirets normalisés", _DASHES_RE)
+)
+
+# Espaces autour de la ponctuation
+_SPACE_BEFORE_PUNCT_RE = re.compile(r'\s+([.!?:;,])')
+_SPACE_AFTER_PUNCT_RE = re.compile(r'([.!?:;,])([A-Za-z])')
+
+# Problèmes d'encodage courants
+_ENCODING_FIXES = {
+    'Ã©': 'é', 'Ã¨': 'è', 'Ã ': 'à', 'Ã§': 'ç', 'Ã´': 'ô', 'Ã¢': 'â', 
+    'Ãª': 'ê', 'Ã®': 'î', 'Ã¹': 'ù', 'Ã»': 'û', 'Ã¯': 'ï', 'Ã«': 'ë',
+    'Â': ''
+}
+# Toutes les séquences corrigées en un seul passage
+_ENCODING_FIXES_RE = re.compile('|'.join(map(re.escape, _ENCODING_FIXES)))
+
+# Configuration optimisée pour la recherche
+_SEARCH_CONFIG = {
+    'lowercase': True,
+    'remove_accents': True,
+    'normalize_punctuation': True,
+    'normalize_quotes': True,
+    'normalize_dashes': True,
+    'normalize_spaces': True,
+    'fix_encoding': True
+}
+
+# Configuration optimisée pour LLM (préserver la casse et les accents)
+_LLM_CONFIG = {
+    'lowercase': False,
+    'remove_accents': False,
+    'normalize_punctuation': True,
+    'normalize_quotes': True,
+    'normalize_dashes': True,
+    'normalize_spaces': True,
+    'fix_encoding': True
+}
+
+@lru_cache(maxsize=1)
+def _combining_marks_table() -> Dict[int, None]:
+    """
+    Construit (une seule fois) la table str.translate supprimant les marques diacritiques.
+    
+    Returns:
+        Dictionnaire associant chaque point de code de catégorie 'Mn' à None
+    """
+    return dict.fromkeys(
+        codepoint for codepoint in range(sys.maxunicode + 1)
+        if unicodedata.category(chr(codepoint)) == 'Mn'
+    )
+
 class TextNormalizer:
     """
     Classe pour normaliser le texte (casse, accents, ponctuation, etc.).
@@ -42,34 +120,27 @@ class TextNormalizer:
     
     def _init_patterns(self):
         """
-        Initialise les patterns de normalisation.
+        Initialise les patterns de normalisation (compilés une seule fois au niveau du module).
         """
-        # Guillemets et apostrophes
-        self.quotes_pattern = re.compile(r'[`´]')
-        self.double_quotes_pattern = re.compile(r'[«»]')
-        
-        # Tirets et traits d'union
-        self.dashes_pattern = re.compile(r'[–—―]')
-        
-        # Espaces spéciaux
-        self.special_spaces_pattern = re.compile(r'[\u00A0\u2000-\u200B\u2028\u2029\u202F\u205F\u3000]')
-        
-        # Points de suspension
-        self.ellipsis_pattern = re.compile(r'…')
-        
-        # Problèmes d'encodage courants
-        self.encoding_fixes = {
-            'Ã©': 'é', 'Ã¨': 'è', 'Ã ': 'à', 'Ã§': 'ç', 'Ã´': 'ô', 'Ã¢': 'â', 
-            'Ãª': 'ê', 'Ã®': 'î', 'Ã¹': 'ù', 'Ã»': 'û', 'Ã¯': 'ï', 'Ã«': 'ë',
-            'Â': ''
-        }
+        self.quotes_pattern = _QUOTES_RE
+        self.double_quotes_pattern = _DOUBLE_QUOTES_RE
+        self.dashes_pattern = _DASHES_RE
+        self.special_spaces_pattern = _SPECIAL_SPACES_RE
+        self.ellipsis_pattern = _ELLIPSIS_RE
+        self.characters_table = _CHARACTERS_TABLE
+        self.characters_steps = _CHARACTERS_STEPS
+        self.space_before_punct_pattern = _SPACE_BEFORE_PUNCT_RE
+        self.space_after_punct_pattern = _SPACE_AFTER_PUNCT_RE
+        self.encoding_fixes = dict(_ENCODING_FIXES)
+        self.encoding_fixes_pattern = _ENCODING_FIXES_RE
     
-    def normalize(self, text: str) -> Dict[str, Any]:
+    def normalize(self, text: str, config: Optional[Dict[str, bool]] = None) -> Dict[str, Any]:
         """
         Normalise le texte selon les paramètres configurés.
         
         Args:
             text: Texte à normaliser
+            config: Options remplaçant celles de l'instance pour cet appel uniquement
             
         Returns:
             Dictionnaire avec le texte normalisé et les statistiques
@@ -84,73 +155,103 @@ class TextNormalizer:
                 }
             }
         
+        options = {
+            'lowercase': self.lowercase,
+            'remove_accents': self.remove_accents,
+            'normalize_punctuation': self.normalize_punctuation,
+            'normalize_quotes': self.normalize_quotes,
+            'normalize_dashes': self.normalize_dashes,
+            'normalize_spaces': self.normalize_spaces,
+            'fix_encoding': self.fix_encoding
+        }
+        if config:
+            options.update(config)
+        
         original_length = len(text)
         normalized_text = text
         normalization_steps = []
         
         # Étape 1: Corriger les problèmes d'encodage
-        if self.fix_encoding:
+        if options['fix_encoding']:
             before_length = len(normalized_text)
             normalized_text = self._fix_encoding_issues(normalized_text)
             if len(normalized_text) != before_length:
                 normalization_steps.append("Problèmes d'encodage corrigés")
         
-        # Étape 2: Normalisation Unicode
-        before_length = len(normalized_text)
-        normalized_text = unicodedata.normalize('NFKC', normalized_text)
-        if len(normalized_text) != before_length:
-            normalization_steps.append("Normalisation Unicode appliquée")
-        
-        # Étape 3: Normaliser les espaces spéciaux
-        if self.normalize_spaces:
-            before_text = normalized_text
-            normalized_text = self.special_spaces_pattern.sub(' ', normalized_text)
-            if normalized_text != before_text:
-                normalization_steps.append("Espaces spéciaux normalisés")
-        
-        # Étape 4: Normaliser les guillemets
-        if self.normalize_quotes:
-            before_text = normalized_text
-            normalized_text = self.quotes_pattern.sub("'", normalized_text)
-            normalized_text = self.double_quotes_pattern.sub('"', normalized_text)
-            if normalized_text != before_text:
-                normalization_steps.append("Guillemets normalisés")
-        
-        # Étape 5: Normaliser les tirets
-        if self.normalize_dashes:
+        # Étape 2: Normalisation Unicode (un texte ASCII est déjà sous forme NFKC)
+        if not normalized_text.isascii():
+            before_length = len(normalized_text)
+            normalized_text = unicodedata.normalize('NFKC', normalized_text)
+            if len(normalized_text) != before_length:
+                normalization_steps.append("Normalisation Unicode appliquée")
+        
+        # Étapes 3 à 5 (cas courant où elles sont toutes actives) : un seul str.translate,
+        # qui remplace aussi les points de suspension de l'étape 6
+        translate_characters = (
+            options['normalize_spaces'] and options['normalize_quotes']
+            and options['normalize_dashes'] and options['normalize_punctuation']
+        )
+        punctuation_count = 0
+        if translate_characters:
             before_text = normalized_text
-            normalized_text = self.dashes_pattern.sub('-', normalized_text)
+            normalized_text = normalized_text.translate(self.characters_table)
             if normalized_text != before_text:
-                normalization_steps.append("Tirets normalisés")
+                normalization_steps.extend(
+                    message for message, pattern in self.characters_steps
+                    if pattern.search(before_text)
+                )
+                punctuation_count = before_text.count('…')
+        else:
+            # Étape 3: Normaliser les espaces spéciaux
+            if options['normalize_spaces']:
+                normalized_text, count = self.special_spaces_pattern.subn(' ', normalized_text)
+                if count:
+                    normalization_steps.append("Espaces spéciaux normalisés")
+            
+            # Étape 4: Normaliser les guillemets
+            if options['normalize_quotes']:
+                normalized_text, count = self.quotes_pattern.subn("'", normalized_text)
+                normalized_text, double_count = self.double_quotes_pattern.subn('"', normalized_text)
+                if count or double_count:
+                    normalization_steps.append("Guillemets normalisés")
+            
+            # Étape 5: Normaliser les tirets
+            if options['normalize_dashes']:
+                normalized_text, count = self.dashes_pattern.subn('-', normalized_text)
+                if count:
+                    normalization_steps.append("Tirets normalisés")
         
         # Étape 6: Normaliser la ponctuation
-        if self.normalize_punctuation:
-            before_text = normalized_text
-            # Points de suspension
-            normalized_text = self.ellipsis_pattern.sub('...', normalized_text)
+        if options['normalize_punctuation']:
+            # Points de suspension (déjà remplacés par la table de traduction)
+            if not translate_characters:
+                normalized_text, punctuation_count = self.ellipsis_pattern.subn('...', normalized_text)
             # Espaces avant la ponctuation
-            normalized_text = re.sub(r'\s+([.!?:;,])', r'\1', normalized_text)
+            normalized_text, count = self.space_before_punct_pattern.subn(r'\1', normalized_text)
+            punctuation_count += count
             # Espaces après la ponctuation
-            normalized_text = re.sub(r'([.!?:;,])([A-Za-z])', r'\1 \2', normalized_text)
-            if normalized_text != before_text:
+            normalized_text, count = self.space_after_punct_pattern.subn(r'\1 \2', normalized_text)
+            punctuation_count += count
+            if punctuation_count:
                 normalization_steps.append("Ponctuation normalisée")
         
         # Étape 7: Supprimer les accents si demandé
-        if self.remove_accents:
+        if options['remove_accents']:
             before_text = normalized_text
             normalized_text = self._remove_accents(normalized_text)
             if normalized_text != before_text:
                 normalization_steps.append("Accents supprimés")
         
         # Étape 8: Convertir en minuscules si demandé
-        if self.lowercase:
+        if options['lowercase']:
             before_text = normalized_text
             normalized_text = normalized_text.lower()
             if normalized_text != before_text:
                 normalization_steps.append("Converti en minuscules")
         
         # Nettoyage final des espaces
-        normalized_text = re.sub(r'\s+', ' ', normalized_text).strip()
+        # (str.split sans argument coupe sur les mêmes espaces Unicode que \s)
+        normalized_text = ' '.join(normalized_text.split())
         
         # Statistiques
         normalization_stats = {
@@ -177,12 +278,12 @@ class TextNormalizer:
         Returns:
             Texte avec encodage corrigé
         """
-        fixed_text = text
+        # Toutes les séquences commencent par 'Ã' ou 'Â'
+        if 'Ã' not in text and 'Â' not in text:
+            return text
         
-        for wrong, correct in self.encoding_fixes.items():
-            fixed_text = fixed_text.replace(wrong, correct)
-        
-        return fixed_text
+        get_fix = self.encoding_fixes.get
+        return self.encoding_fixes_pattern.sub(lambda match: get_fix(match.group(0), ''), text)
     
     def _remove_accents(self, text: str) -> str:
         """
@@ -194,16 +295,12 @@ class TextNormalizer:
         Returns:
             Texte sans accents
         """
-        # Décomposer les caractères Unicode
-        nfkd_form = unicodedata.normalize('NFD', text)
-        
-        # Supprimer les marques diacritiques
-        without_accents = ''.join([
-            char for char in nfkd_form 
-            if unicodedata.category(char) != 'Mn'
-        ])
+        # Un texte ASCII ne contient aucun accent
+        if text.isascii():
+            return text
         
-        return without_accents
+        # Décomposer les caractères Unicode puis supprimer les marques diacritiques
+        return unicodedata.normalize('NFD', text).translate(_combining_marks_table())
     
     def normalize_for_search(self, text: str) -> str:
         """
@@ -215,33 +312,10 @@ class TextNormalizer:
         Returns:
             Texte normalisé pour la recherche
         """
-        # Configuration spéciale pour la recherche
-        original_config = {
-            'lowercase': self.lowercase,
-            'remove_accents': self.remove_accents,
-            'normalize_punctuation': self.normalize_punctuation,
-            'normalize_quotes': self.normalize_quotes,
-            'normalize_dashes': self.normalize_dashes,
-            'normalize_spaces': self.normalize_spaces,
-            'fix_encoding': self.fix_encoding
-        }
-        
-        # Configuration optimisée pour la recherche
-        self.lowercase = True
-        self.remove_accents = True
-        self.normalize_punctuation = True
-        self.normalize_quotes = True
-        self.normalize_dashes = True
-        self.normalize_spaces = True
-        self.fix_encoding = True
-        
-        result = self.normalize(text)
+        # Configuration optimisée pour la recherche, sans modifier celle de l'instance
+        result = self.normalize(text, config=_SEARCH_CONFIG)
         normalized_text = result['normalized_text']
         
-        # Restaurer la configuration originale
-        for key, value in original_config.items():
-            setattr(self, key, value)
-        
         return normalized_text
     
     def normalize_for_llm(self, text: str) -> str:
@@ -254,31 +328,8 @@ class TextNormalizer:
         Returns:
             Texte normalisé pour LLM
         """
-        # Configuration spéciale pour LLM (préserver la casse et les accents)
-        original_config = {
-            'lowercase': self.lowercase,
-            'remove_accents': self.remove_accents,
-            'normalize_punctuation': self.normalize_punctuation,
-            'normalize_quotes': self.normalize_quotes,
-            'normalize_dashes': self.normalize_dashes,
-            'normalize_spaces': self.normalize_spaces,
-            'fix_encoding': self.fix_encoding
-        }
-        
-        # Configuration optimisée pour LLM
-        self.lowercase = False  # Préserver la casse
-        self.remove_accents = False  # Préserver les accents
-        self.normalize_punctuation = True
-        self.normalize_quotes = True
-        self.normalize_dashes = True
-        self.normalize_spaces = True
-        self.fix_encoding = True
-        
-        result = self.normalize(text)
+        # Configuration optimisée pour LLM, sans modifier celle de l'instance
+        result = self.normalize(text, config=_LLM_CONFIG)
         normalized_text = result['normalized_text']
         
-        # Restaurer la configuration originale
-        for key, value in original_config.items():
-            setattr(self, key, value)
-        
         return normalized_text
\ No newline at end of file
@@ -22,6 +22,19 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Formatage inline en une seule alternance : à position égale, l'ordre des
+# alternatives donne la priorité (gras, italique, code, italique alternatif)
+_INLINE_RE = re.compile(
+    r'\*\*(?P<bold>.+?)\*\*'         # Gras
+    r'|\*(?P<italic>.+?)\*'           # Italique
+    r'|`(?P<code>.+?)`'               # Code inline
+    r'|_(?P<italic_alt>.+?)_'         # Italique alternatif
+)
+
+# Éléments de liste numérotée
+_NUMBERED_ITEM_RE = re.compile(r'^\s*\d+\.')
+_NUMBERED_PREFIX_RE = re.compile(r'^\s*\d+\.\s*')
+
 class MarkdownToDOCXConverter:
     """
     Convertisseur Markdown vers DOCX avec préservation de la mise en forme.
@@ -32,6 +45,8 @@ class MarkdownToDOCXConverter:
         Initialise le convertisseur.
         """
         self.document = None
+        # Dernier paragraphe ajouté (évite de parcourir document.paragraphs)
+        self._last_paragraph = None
         self._init_styles_config()
     
     def _init_styles_config(self):
@@ -164,11 +179,28 @@ class MarkdownToDOCXConverter:
         """
         Parse et convertit le contenu Markdown.
         
+        Le contenu est d'abord analysé en une liste de nœuds, puis rendu en
+        une seule passe dans le document.
+        
+        Args:
+            markdown_content: Contenu Markdown à parser
+        """
+        nodes = self._parse_to_ir(markdown_content)
+        self._render_nodes(nodes)
+    
+    def _parse_to_ir(self, markdown_content: str) -> List[Dict[str, Any]]:
+        """
+        Analyse le Markdown en une liste de nœuds (représentation intermédiaire).
+        
         Args:
             markdown_content: Contenu Markdown à parser
+            
+        Returns:
+            Liste de dictionnaires décrivant chaque bloc ('kind' et contenu)
         """
         # Diviser le contenu en lignes
         lines = markdown_content.split('\n')
+        nodes = []
         
         i = 0
         while i < len(lines):
@@ -176,158 +208,68 @@ class MarkdownToDOCXConverter:
             
             # Titres
             if line.startswith('#'):
-                self._add_heading(line)
+                nodes.append(self._parse_heading(line))
             
             # Listes
-            elif line.strip().startswith(('-', '*', '+')) or re.match(r'^\s*\d+\.', line):
-                i = self._add_list(lines, i)
+            elif line.strip().startswith(('-', '*', '+')) or _NUMBERED_ITEM_RE.match(line):
+                i = self._parse_list(lines, i, nodes)
                 continue
             
             # Blocs de code
             elif line.strip().startswith('```'):
-                i = self._add_code_block(lines, i)
+                i = self._parse_code_block(lines, i, nodes)
                 continue
             
             # Citations
             elif line.strip().startswith('>'):
-                i = self._add_blockquote(lines, i)
+                i = self._parse_blockquote(lines, i, nodes)
                 continue
             
             # Tableaux
             elif '|' in line and line.strip():
-                i = self._add_table(lines, i)
+                i = self._parse_table(lines, i, nodes)
                 continue
             
             # Paragraphe normal
             elif line.strip():
-                self._add_paragraph(line)
+                nodes.append({'kind': 'paragraph', 'text': line})
             
-            # Ligne vide - ajouter un saut
+            # Ligne vide - saut de paragraphe
             else:
-                if self.document.paragraphs and self.document.paragraphs[-1].text.strip():
-                    self.document.add_paragraph()
+                nodes.append({'kind': 'break'})
             
             i += 1
+        
+        return nodes
     
-    def _add_heading(self, line: str):
+    def _parse_heading(self, line: str) -> Dict[str, Any]:
         """
-        Ajoute un titre.
+        Analyse un titre.
         
         Args:
             line: Ligne contenant le titre
+            
+        Returns:
+            Nœud du titre
         """
         # Compter les # pour déterminer le niveau
-        level = 0
-        for char in line:
-            if char == '#':
-                level += 1
-            else:
-                break
-        
-        # Extraire le texte du titre
-        title_text = line[level:].strip()
-        
-        # Ajouter le titre (limiter à 3 niveaux)
-        heading_level = min(level, 3)
-        heading = self.document.add_heading(title_text, level=heading_level)
-        
-        # Appliquer le style personnalisé
-        if heading_level == 1:
-            self._apply_heading_style(heading, 'heading_1')
-        elif heading_level == 2:
-            self._apply_heading_style(heading, 'heading_2')
-        else:
-            self._apply_heading_style(heading, 'heading_3')
-    
-    def _apply_heading_style(self, heading, style_name: str):
-        """
-        Applique un style à un titre.
+        level = len(line) - len(line.lstrip('#'))
         
-        Args:
-            heading: Élément titre
-            style_name: Nom du style à appliquer
-        """
-        style_config = self.styles_config.get(style_name, {})
-        
-        for run in heading.runs:
-            if 'font_size' in style_config:
-                run.font.size = style_config['font_size']
-            if 'bold' in style_config:
-                run.font.bold = style_config['bold']
-    
-    def _add_paragraph(self, line: str):
-        """
-        Ajoute un paragraphe avec formatage inline.
-        
-        Args:
-            line: Ligne de texte
-        """
-        paragraph = self.document.add_paragraph()
-        
-        # Parser le formatage inline
-        self._parse_inline_formatting(paragraph, line)
-    
-    def _parse_inline_formatting(self, paragraph, text: str):
-        """
-        Parse le formatage inline (gras, italique, code).
-        
-        Args:
-            paragraph: Paragraphe où ajouter le texte
-            text: Texte à parser
-        """
-        # Patterns pour le formatage
-        patterns = [
-            (r'\*\*(.+?)\*\*', 'bold'),      # Gras
-            (r'\*(.+?)\*', 'italic'),        # Italique
-            (r'`(.+?)`', 'code'),            # Code inline
-            (r'_(.+?)_', 'italic'),          # Italique alternatif
-        ]
-        
-        remaining_text = text
-        
-        while remaining_text:
-            earliest_match = None
-            earliest_pos = len(remaining_text)
-            
-            # Trouver le premier pattern
-            for pattern, format_type in patterns:
-                match = re.search(pattern, remaining_text)
-                if match and match.start() < earliest_pos:
-                    earliest_match = (match, format_type)
-                    earliest_pos = match.start()
-            
-            if earliest_match:
-                match, format_type = earliest_match
-                
-                # Ajouter le texte avant le match
-                if match.start() > 0:
-                    paragraph.add_run(remaining_text[:match.start()])
-                
-                # Ajouter le texte formaté
-                formatted_run = paragraph.add_run(match.group(1))
-                
-                if format_type == 'bold':
-                    formatted_run.bold = True
-                elif format_type == 'italic':
-                    formatted_run.italic = True
-                elif format_type == 'code':
-                    formatted_run.font.name = 'Courier New'
-                    formatted_run.font.size = Pt(10)
-                
-                # Continuer avec le reste du texte
-                remaining_text = remaining_text[match.end():]
-            else:
-                # Pas de formatage trouvé, ajouter le reste
-                paragraph.add_run(remaining_text)
-                break
+        # Extraire le texte du titre (limiter à 3 niveaux)
+        return {
+            'kind': 'heading',
+            'level': min(level, 3),
+            'text': line[level:].strip()
+        }
     
-    def _add_list(self, lines: List[str], start_index: int) -> int:
+    def _parse_list(self, lines: List[str], start_index: int, nodes: List[Dict[str, Any]]) -> int:
         """
-        Ajoute une liste.
+        Analyse une liste.
         
         Args:
             lines: Toutes les lignes
             start_index: Index de début de la liste
+            nodes: Liste de nœuds à compléter
             
         Returns:
             Index de la prochaine ligne à traiter
@@ -341,126 +283,248 @@ class MarkdownToDOCXConverter:
             if line.strip().startswith(('-', '*', '+')):
                 # Liste à puces
                 text = line.strip()[1:].strip()
-                paragraph = self.document.add_paragraph(text, style='List Bullet')
-            elif re.match(r'^\s*\d+\.', line):
+                nodes.append({'kind': 'list_item', 'style': 'List Bullet', 'text': text})
+            elif _NUMBERED_ITEM_RE.match(line):
                 # Liste numérotée
-                text = re.sub(r'^\s*\d+\.\s*', '', line)
-                paragraph = self.document.add_paragraph(text, style='List Number')
+                text = _NUMBERED_PREFIX_RE.sub('', line)
+                nodes.append({'kind': 'list_item', 'style': 'List Number', 'text': text})
             else:
                 # Fin de la liste
                 break
             
             i += 1
         
-        return i - 1
+        return i
     
-    def _add_code_block(self, lines: List[str], start_index: int) -> int:
+    def _parse_code_block(self, lines: List[str], start_index: int, nodes: List[Dict[str, Any]]) -> int:
         """
-        Ajoute un bloc de code.
+        Analyse un bloc de code.
         
         Args:
             lines: Toutes les lignes
             start_index: Index de début du bloc
+            nodes: Liste de nœuds à compléter
             
         Returns:
             Index de la prochaine ligne à traiter
         """
-        i = start_index + 1  # Ignorer la ligne ```
-        code_lines = []
-        
-        while i < len(lines):
-            line = lines[i]
-            if line.strip().startswith('```'):
-                break
-            code_lines.append(line)
-            i += 1
-        
-        # Ajouter le bloc de code
-        code_text = '\n'.join(code_lines)
-        paragraph = self.document.add_paragraph()
-        run = paragraph.add_run(code_text)
-        run.font.name = 'Courier New'
-        run.font.size = Pt(10)
-        
-        return i
+        # Chercher la ligne ``` fermante puis extraire le contenu en une fois
+        end = next(
+            (j for j in range(start_index + 1, len(lines)) if lines[j].lstrip().startswith('```')),
+            len(lines)
+        )
+        nodes.append({'kind': 'code', 'text': '\n'.join(lines[start_index + 1:end])})
+        
+        # Reprendre après la ligne ``` fermante
+        return end + 1
     
-    def _add_blockquote(self, lines: List[str], start_index: int) -> int:
+    def _parse_blockquote(self, lines: List[str], start_index: int, nodes: List[Dict[str, Any]]) -> int:
         """
-        Ajoute une citation.
+        Analyse une citation.
         
         Args:
             lines: Toutes les lignes
             start_index: Index de début de la citation
+            nodes: Liste de nœuds à compléter
             
         Returns:
             Index de la prochaine ligne à traiter
         """
-        i = start_index
-        quote_lines = []
+        end = self._scan_block(lines, start_index, lambda line: line.strip().startswith('>'))
         
-        while i < len(lines):
-            line = lines[i]
-            if line.strip().startswith('>'):
-                quote_text = line.strip()[1:].strip()
-                quote_lines.append(quote_text)
-            else:
-                break
-            i += 1
-        
-        # Ajouter la citation
-        quote_text = ' '.join(quote_lines)
-        paragraph = self.document.add_paragraph(quote_text, style='Quote')
+        quote_text = ' '.join(line.strip()[1:].strip() for line in lines[start_index:end])
+        nodes.append({'kind': 'quote', 'text': quote_text})
         
-        return i - 1
+        return end
     
-    def _add_table(self, lines: List[str], start_index: int) -> int:
+    def _parse_table(self, lines: List[str], start_index: int, nodes: List[Dict[str, Any]]) -> int:
         """
-        Ajoute un tableau.
+        Analyse un tableau.
         
         Args:
             lines: Toutes les lignes
             start_index: Index de début du tableau
+            nodes: Liste de nœuds à compléter
             
         Returns:
             Index de la prochaine ligne à traiter
         """
-        i = start_index
-        table_lines = []
-        
-        while i < len(lines):
-            line = lines[i]
-            if '|' in line and line.strip():
-                table_lines.append(line)
-            else:
-                break
-            i += 1
-        
-        if len(table_lines) < 2:
-            return i - 1
+        end = self._scan_block(lines, start_index, lambda line: '|' in line and line.strip())
+        table_lines = lines[start_index:end]
         
         # Parser le tableau
         rows = []
-        for line in table_lines:
-            if '---' in line:  # Ligne de séparation
-                continue
-            cells = [cell.strip() for cell in line.split('|')[1:-1]]  # Ignorer les | de début/fin
-            if cells:
-                rows.append(cells)
+        if len(table_lines) >= 2:
+            for line in table_lines:
+                if '---' in line:  # Ligne de séparation
+                    continue
+                cells = [cell.strip() for cell in line.split('|')[1:-1]]  # Ignorer les | de début/fin
+                if cells:
+                    rows.append(cells)
+        
+        if rows:
+            nodes.append({'kind': 'table', 'rows': rows})
+        else:
+            # Tableau non reconnu : lignes conservées comme paragraphes
+            nodes.extend({'kind': 'paragraph', 'text': line} for line in table_lines)
         
-        if not rows:
-            return i - 1
+        return end
+    
+    def _scan_block(self, lines: List[str], start_index: int, predicate) -> int:
+        """
+        Trouve la fin d'un bloc de lignes consécutives vérifiant un prédicat.
         
-        # Créer le tableau
-        table = self.document.add_table(rows=len(rows), cols=len(rows[0]))
-        table.style = 'Table Grid'
+        Args:
+            lines: Toutes les lignes
+            start_index: Index de début du bloc
+            predicate: Fonction indiquant si une ligne appartient au bloc
+            
+        Returns:
+            Index de la première ligne hors du bloc
+        """
+        end = start_index
+        while end < len(lines) and predicate(lines[end]):
+            end += 1
+        return end
+    
+    def _render_nodes(self, nodes: List[Dict[str, Any]]):
+        """
+        Rend les nœuds dans le document.
+        
+        Chaque bloc est inséré avant un paragraphe sentinelle (insertion en
+        temps constant) au lieu d'être ajouté en fin de corps, où python-docx
+        recherche sectPr parmi tous les éléments existants.
+        
+        Args:
+            nodes: Nœuds produits par _parse_to_ir
+        """
+        sentinel = self.document.add_paragraph()
+        self._last_paragraph = None
+        
+        for node in nodes:
+            kind = node['kind']
+            
+            if kind == 'heading':
+                self._render_heading(sentinel, node)
+            
+            elif kind == 'paragraph':
+                paragraph = sentinel.insert_paragraph_before()
+                self._last_paragraph = paragraph
+                self._parse_inline_formatting(paragraph, node['text'])
+            
+            elif kind == 'list_item':
+                self._last_paragraph = sentinel.insert_paragraph_before(node['text'], style=node['style'])
+            
+            elif kind == 'code':
+                paragraph = sentinel.insert_paragraph_before()
+                self._last_paragraph = paragraph
+                run = paragraph.add_run(node['text'])
+                run.font.name = 'Courier New'
+                run.font.size = Pt(10)
+            
+            elif kind == 'quote':
+                self._last_paragraph = sentinel.insert_paragraph_before(node['text'], style='Quote')
+            
+            elif kind == 'table':
+                self._render_table(sentinel, node['rows'])
+            
+            # Saut uniquement après un paragraphe non vide (document.paragraphs
+            # reparcourrait tout le corps)
+            elif kind == 'break':
+                if self._last_paragraph is not None and self._last_paragraph.text.strip():
+                    self._last_paragraph = sentinel.insert_paragraph_before()
+        
+        # Retirer la sentinelle
+        sentinel._element.getparent().remove(sentinel._element)
+    
+    def _render_heading(self, sentinel, node: Dict[str, Any]):
+        """
+        Insère un titre avant la sentinelle.
+        
+        Args:
+            sentinel: Paragraphe sentinelle
+            node: Nœud du titre
+        """
+        heading_level = node['level']
+        heading = sentinel.insert_paragraph_before(node['text'], style=f'Heading {heading_level}')
+        self._last_paragraph = heading
+        
+        # Appliquer le style personnalisé
+        if heading_level == 1:
+            self._apply_heading_style(heading, 'heading_1')
+        elif heading_level == 2:
+            self._apply_heading_style(heading, 'heading_2')
+        else:
+            self._apply_heading_style(heading, 'heading_3')
+    
+    def _apply_heading_style(self, heading, style_name: str):
+        """
+        Applique un style à un titre.
         
-        # Remplir le tableau
-        for row_idx, row_data in enumerate(rows):
-            for col_idx, cell_data in enumerate(row_data):
-                if col_idx < len(table.rows[row_idx].cells):
-                    table.rows[row_idx].cells[col_idx].text = cell_data
+        Args:
+            heading: Élément titre
+            style_name: Nom du style à appliquer
+        """
+        style_config = self.styles_config.get(style_name, {})
         
-        return i - 1
+        for run in heading.runs:
+            if 'font_size' in style_config:
+                run.font.size = style_config['font_size']
+            if 'bold' in style_config:
+                run.font.bold = style_config['bold']
+    
+    def _parse_inline_formatting(self, paragraph, text: str):
+        """
+        Parse le formatage inline (gras, italique, code).
+        
+        Args:
+            paragraph: Paragraphe où ajouter le texte
+            text: Texte à parser
+        """
+        position = 0
+        
+        for match in _INLINE_RE.finditer(text):
+            # Ajouter le texte avant le match
+            if match.start() > position:
+                paragraph.add_run(text[position:match.start()])
+            
+            # Ajouter le texte formaté (le groupe nommé indique le format)
+            format_type = match.lastgroup
+            formatted_run = paragraph.add_run(match.group(format_type))
+            
+            if format_type == 'bold':
+                formatted_run.bold = True
+            elif format_type in ('italic', 'italic_alt'):
+                formatted_run.italic = True
+            elif format_type == 'code':
+                formatted_run.font.name = 'Courier New'
+                formatted_run.font.size = Pt(10)
+            
+            position = match.end()
+        
+        # Ajouter le reste du texte sans formatage
+        if position < len(text):
+            paragraph.add_run(text[position:])
+    
+    def _render_table(self, sentinel, rows: List[List[str]]):
+        """
+        Insère un tableau avant la sentinelle.
+        
+        Args:
+            sentinel: Paragraphe sentinelle
+            rows: Lignes du tableau (liste de cellules)
+        """
+        # Créer le tableau puis le déplacer avant la sentinelle
+        table = self.document.add_table(rows=len(rows), cols=len(rows[0]))
+        table.style = 'Table Grid'
+        sentinel._element.addprevious(table._element)
+        
+        # Remplir le tableau (cellules récupérées une seule fois par ligne :
+        # row.cells reparcourt le XML à chaque accès)
+        for row, row_data in zip(table.rows, rows):
+            row_cells = row.cells
+            for cell, cell_data in zip(row_cells, row_data):
+                cell.text = cell_data
     
     def convert_file(self, 
                     markdown_file_path: str,
@@ -9,6 +9,12 @@ try:
 except ImportError:
     raise ImportError("Veuillez installer markdown: pip install markdown")
 
+try:
+    import cmarkgfm
+    from cmarkgfm.cmark import Options as CmarkOptions
+except ImportError:
+    cmarkgfm = None
+
 try:
     import weasyprint
 except ImportError:
@@ -19,6 +25,15 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Extensions Markdown utilisées pour le rendu HTML
+_MARKDOWN_EXTENSIONS = [
+    'markdown.extensions.tables',
+    'markdown.extensions.fenced_code',
+    'markdown.extensions.codehilite',
+    'markdown.extensions.toc',
+    'markdown.extensions.nl2br'
+]
+
 class MarkdownToPDFConverter:
     """
     Convertisseur Markdown vers PDF avec support de styles personnalisés.
@@ -34,6 +49,16 @@ class MarkdownToPDFConverter:
         self.use_weasyprint = use_weasyprint
         self._init_css_styles()
         
+        # Parseur Markdown : cmarkgfm (C) si disponible, sinon markdown créé
+        # une seule fois (chargement des extensions) et réinitialisé à chaque
+        # conversion
+        if cmarkgfm is not None:
+            self._md = None
+            self._md_convert = self._convert_with_cmarkgfm
+        else:
+            self._md = markdown.Markdown(extensions=_MARKDOWN_EXTENSIONS)
+            self._md_convert = self._convert_with_markdown
+        
         # Vérifier la disponibilité des outils
         if self.use_weasyprint:
             try:
@@ -256,18 +281,8 @@ class MarkdownToPDFConverter:
         Returns:
             Contenu HTML
         """
-        # Configuration des extensions Markdown
-        extensions = [
-            'markdown.extensions.tables',
-            'markdown.extensions.fenced_code',
-            'markdown.extensions.codehilite',
-            'markdown.extensions.toc',
-            'markdown.extensions.nl2br'
-        ]
-        
         # Conversion Markdown vers HTML
-        md = markdown.Markdown(extensions=extensions)
-        html_body = md.convert(markdown_content)
+        html_body = self._md_convert(markdown_content)
         
         # Construction du HTML complet
         title = "Document InspireDoc"
@@ -290,6 +305,37 @@ class MarkdownToPDFConverter:
         
         return html_content
     
+    def _convert_with_markdown(self, markdown_content: str) -> str:
+        """
+        Convertit le Markdown en HTML avec la bibliothèque markdown.
+        
+        Args:
+            markdown_content: Contenu Markdown
+            
+        Returns:
+            Corps HTML
+        """
+        return self._md.reset().convert(markdown_content)
+    
+    def _convert_with_cmarkgfm(self, markdown_content: str) -> str:
+        """
+        Convertit le Markdown en HTML avec cmarkgfm (GitHub Flavored Markdown).
+        
+        Les tableaux et blocs de code délimités sont natifs en GFM ; les
+        retours à la ligne simples sont conservés comme avec nl2br et le
+        HTML brut est transmis comme avec la bibliothèque markdown.
+        
+        Args:
+            markdown_content: Contenu Markdown
+            
+        Returns:
+            Corps HTML
+        """
+        return cmarkgfm.github_flavored_markdown_to_html(
+            markdown_content,
+            options=CmarkOptions.CMARK_OPT_HARDBREAKS | CmarkOptions.CMARK_OPT_UNSAFE
+        )
+    
     def _convert_with_weasyprint(self, html_content: str, css_styles: str, output_path: str) -> bool:
         """
         Convertit avec WeasyPrint.
@@ -410,6 +456,7 @@ class MarkdownToPDFConverter:
         return {
             'available': self.converter_available,
             'preferred_converter': 'weasyprint' if self.use_weasyprint else 'pdfkit',
+            'markdown_parser': 'cmarkgfm' if cmarkgfm is not None else 'markdown',
             'weasyprint_available': 'weasyprint' in globals(),
             'pdfkit_available': 'pdfkit' in globals()
         }
\ No newline at end of file
@@ -37,7 +37,10 @@ class DocumentService:
         
         # Initialisation des composants
         self.pdf_loader = PDFLoader()
-        self.txt_loader = TXTLoader()
+        if Settings.TXT_ENCODING:
+            self.txt_loader = TXTLoader(default_encoding=Settings.TXT_ENCODING, trust_default=True)
+        else:
+            self.txt_loader = TXTLoader()
         self.docx_loader = DOCXLoader()
         
         self.text_cleaner = TextCleaner()
@@ -236,23 +239,6 @@ class DocumentService:
                 'source': 'text_input',
                 'error': str(e)
             }
-            
-            # Nettoyage du fichier temporaire
-            try:
-                os.remove(temp_path)
-            except Exception as e:
-                logger.warning(f"Impossible de supprimer le fichier temporaire {temp_path}: {str(e)}")
-            
-            logger.info(f"Fichier traité avec succès: {file.name} -> {len(normalized_text)} caractères")
-            
-            return {
-                'text': normalized_text,
-                'metadata': processed_metadata
-            }
-            
-        except Exception as e:
-            logger.error(f"Erreur lors du traitement du fichier {file.name}: {str(e)}")
-            return None
     
     def _extract_content(self, file_path: str, original_name: str) -> Optional[Dict[str, Any]]:
         """
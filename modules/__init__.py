@@ -0,0 +1,21 @@
+# Modules package
+import importlib
+from typing import Callable
+
+def load_interface(module_name: str, function_name: str) -> Callable[[], None]:
+    """
+    Importe paresseusement la fonction d'interface d'une page.
+    
+    La fonction est relue sur le module à chaque appel (importlib ne réimporte
+    pas un module déjà chargé) : après un rechargement à chaud par Streamlit,
+    la version à jour de la page est utilisée.
+    
+    Args:
+        module_name: Nom du module dans le package modules (ex: 'generation')
+        function_name: Nom de la fonction d'interface à retourner
+        
+    Returns:
+        La fonction d'interface de la page
+    """
+    module = importlib.import_module(f"modules.{module_name}")
+    return getattr(module, function_name)
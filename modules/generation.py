@@ -10,7 +10,7 @@ logger = logging.getLogger(__name__)
 
 # Imports InspireDoc
 try:
-    from core.services.document_service import DocumentService
+    from components.service_status import get_document_service
     from core.rendering.markdown_to_pdf import MarkdownToPDFConverter
     from core.rendering.markdown_to_docx import MarkdownToDOCXConverter
     from config.settings import Settings
@@ -24,10 +24,10 @@ def show_generation_interface():
     """
     st.header("⚡ Génération de documents")
     
-    # Initialisation du service
+    # Initialisation du service (instance partagée, construite une seule fois)
     if 'document_service' not in st.session_state:
         try:
-            st.session_state.document_service = DocumentService()
+            st.session_state.document_service = get_document_service()
             st.success("✅ Service InspireDoc initialisé")
         except Exception as e:
             st.error(f"❌ Erreur d'initialisation: {str(e)}")
@@ -64,93 +64,97 @@ def show_upload_section():
         **Formats supportés** : PDF, TXT, DOCX (max 10 MB par fichier)
         """)
     
-    # Layout en 3 colonnes pour les 3 documents
-    col1, col2, col3 = st.columns(3)
+    # Formulaire : les saisies ne relancent le script qu'à la soumission
+    with st.form("upload_form", border=False):
+        # Layout en 3 colonnes pour les 3 documents
+        col1, col2, col3 = st.columns(3)
     
-    with col1:
-        st.markdown("**📜 Document source ancien**")
+        with col1:
+            st.markdown("**📜 Document source ancien**")
         
-        # Onglets pour upload ou saisie texte
-        tab1, tab2 = st.tabs(["📁 Upload", "✏️ Texte"])
+            # Onglets pour upload ou saisie texte
+            tab1, tab2 = st.tabs(["📁 Upload", "✏️ Texte"])
         
-        with tab1:
-            old_source_files = st.file_uploader(
-                "Document de référence original",
-                type=['pdf', 'txt', 'docx'],
-                accept_multiple_files=True,
-                key="old_source_files",
-                help="Document original servant de base de référence"
-            )
+            with tab1:
+                old_source_files = st.file_uploader(
+                    "Document de référence original",
+                    type=['pdf', 'txt', 'docx'],
+                    accept_multiple_files=True,
+                    key="old_source_files",
+                    help="Document original servant de base de référence"
+                )
         
-        with tab2:
-            old_source_text = st.text_area(
-                "Saisir le contenu directement",
-                height=200,
-                key="old_source_text",
-                help="Tapez ou collez votre texte de référence",
-                placeholder="Entrez votre document source ancien ici..."
-            )
+            with tab2:
+                old_source_text = st.text_area(
+                    "Saisir le contenu directement",
+                    height=200,
+                    key="old_source_text",
+                    help="Tapez ou collez votre texte de référence",
+                    placeholder="Entrez votre document source ancien ici..."
+                )
     
-    with col2:
-        st.markdown("**🎨 Document exemple construit**")
+        with col2:
+            st.markdown("**🎨 Document exemple construit**")
         
-        # Onglets pour upload ou saisie texte
-        tab1, tab2 = st.tabs(["📁 Upload", "✏️ Texte"])
+            # Onglets pour upload ou saisie texte
+            tab1, tab2 = st.tabs(["📁 Upload", "✏️ Texte"])
         
-        with tab1:
-            example_files = st.file_uploader(
-                "Exemple créé à partir de la source",
-                type=['pdf', 'txt', 'docx'],
-                accept_multiple_files=True,
-                key="example_files",
-                help="Exemple montrant la transformation souhaitée (ancien → exemple)"
-            )
+            with tab1:
+                example_files = st.file_uploader(
+                    "Exemple créé à partir de la source",
+                    type=['pdf', 'txt', 'docx'],
+                    accept_multiple_files=True,
+                    key="example_files",
+                    help="Exemple montrant la transformation souhaitée (ancien → exemple)"
+                )
         
-        with tab2:
-            example_text = st.text_area(
-                "Saisir l'exemple directement",
-                height=200,
-                key="example_text",
-                help="Tapez ou collez votre exemple construit",
-                placeholder="Entrez votre document exemple ici..."
-            )
+            with tab2:
+                example_text = st.text_area(
+                    "Saisir l'exemple directement",
+                    height=200,
+                    key="example_text",
+                    help="Tapez ou collez votre exemple construit",
+                    placeholder="Entrez votre document exemple ici..."
+                )
     
-    with col3:
-        st.markdown("**📄 Nouveau document source**")
+        with col3:
+            st.markdown("**📄 Nouveau document source**")
         
-        # Onglets pour upload ou saisie texte
-        tab1, tab2 = st.tabs(["📁 Upload", "✏️ Texte"])
+            # Onglets pour upload ou saisie texte
+            tab1, tab2 = st.tabs(["📁 Upload", "✏️ Texte"])
         
-        with tab1:
-            new_source_files = st.file_uploader(
-                "Nouvelle information à traiter",
-                type=['pdf', 'txt', 'docx'],
-                accept_multiple_files=True,
-                key="new_source_files",
-                help="Nouveau contenu qui subira la même transformation"
-            )
+            with tab1:
+                new_source_files = st.file_uploader(
+                    "Nouvelle information à traiter",
+                    type=['pdf', 'txt', 'docx'],
+                    accept_multiple_files=True,
+                    key="new_source_files",
+                    help="Nouveau contenu qui subira la même transformation"
+                )
         
-        with tab2:
-            new_source_text = st.text_area(
-                "Saisir le nouveau contenu directement",
-                height=200,
-                key="new_source_text",
-                help="Tapez ou collez votre nouveau contenu",
-                placeholder="Entrez votre nouveau document source ici..."
-            )
-    
-    # Zone de description optionnelle
-    st.markdown("**💬 Description personnalisée (optionnel)**")
-    user_description = st.text_area(
-        "Décrivez le type de document souhaité ou des instructions spécifiques",
-        placeholder="Ex: Créer un rapport technique, adapter le ton pour un public jeune, ajouter des exemples pratiques...",
-        height=100,
-        key="user_description",
-        help="Cette description permettra d'affiner la génération selon vos besoins spécifiques"
-    )
-    
-    # Bouton de traitement
-    if st.button("🔄 Traiter les documents", type="primary"):
+            with tab2:
+                new_source_text = st.text_area(
+                    "Saisir le nouveau contenu directement",
+                    height=200,
+                    key="new_source_text",
+                    help="Tapez ou collez votre nouveau contenu",
+                    placeholder="Entrez votre nouveau document source ici..."
+                )
+    
+        # Zone de description optionnelle
+        st.markdown("**💬 Description personnalisée (optionnel)**")
+        user_description = st.text_area(
+            "Décrivez le type de document souhaité ou des instructions spécifiques",
+            placeholder="Ex: Créer un rapport technique, adapter le ton pour un public jeune, ajouter des exemples pratiques...",
+            height=100,
+            key="user_description",
+            help="Cette description permettra d'affiner la génération selon vos besoins spécifiques"
+        )
+    
+        # Bouton de traitement
+        submitted = st.form_submit_button("🔄 Traiter les documents", type="primary")
+    
+    if submitted:
         # Vérification des contenus (fichiers ou texte)
         has_old_content = bool(old_source_files or st.session_state.get('old_source_text', '').strip())
         has_example_content = bool(example_files or st.session_state.get('example_text', '').strip())
@@ -318,50 +322,53 @@ def show_generation_section():
                 st.session_state.edit_description = False
                 st.rerun()
     
-    # Configuration de génération
-    with st.expander("🔧 Paramètres de génération"):
-        col1, col2 = st.columns(2)
+    with st.form("generation_form", border=False):
+        # Configuration de génération
+        with st.expander("🔧 Paramètres de génération"):
+            col1, col2 = st.columns(2)
         
-        with col1:
-            temperature = st.slider(
-                "Créativité (Temperature)",
-                min_value=0.0,
-                max_value=1.0,
-                value=0.3,
-                step=0.1,
-                help="Plus élevé = plus créatif, plus bas = plus conservateur"
-            )
+            with col1:
+                temperature = st.slider(
+                    "Créativité (Temperature)",
+                    min_value=0.0,
+                    max_value=1.0,
+                    value=0.3,
+                    step=0.1,
+                    help="Plus élevé = plus créatif, plus bas = plus conservateur"
+                )
             
-            max_tokens = st.number_input(
-                "Longueur maximale (tokens)",
-                min_value=500,
-                max_value=4000,
-                value=2000,
-                step=100,
-                help="Nombre maximum de tokens pour la génération"
-            )
+                max_tokens = st.number_input(
+                    "Longueur maximale (tokens)",
+                    min_value=500,
+                    max_value=4000,
+                    value=2000,
+                    step=100,
+                    help="Nombre maximum de tokens pour la génération"
+                )
         
-        with col2:
-            top_p = st.slider(
-                "Diversité (Top-p)",
-                min_value=0.1,
-                max_value=1.0,
-                value=0.9,
-                step=0.1,
-                help="Contrôle la diversité du vocabulaire"
-            )
+            with col2:
+                top_p = st.slider(
+                    "Diversité (Top-p)",
+                    min_value=0.1,
+                    max_value=1.0,
+                    value=0.9,
+                    step=0.1,
+                    help="Contrôle la diversité du vocabulaire"
+                )
             
-            presence_penalty = st.slider(
-                "Éviter les répétitions",
-                min_value=0.0,
-                max_value=2.0,
-                value=0.1,
-                step=0.1,
-                help="Pénalise la répétition de mots"
-            )
-    
-    # Bouton de génération
-    if st.button("🚀 Générer avec transformation intelligente", type="primary"):
+                presence_penalty = st.slider(
+                    "Éviter les répétitions",
+                    min_value=0.0,
+                    max_value=2.0,
+                    value=0.1,
+                    step=0.1,
+                    help="Pénalise la répétition de mots"
+                )
+    
+        # Bouton de génération
+        submitted = st.form_submit_button("🚀 Générer avec transformation intelligente", type="primary")
+    
+    if submitted:
         # Vérifier que nous avons les documents nécessaires
         if not st.session_state.get('processed_old_sources') and not st.session_state.get('processed_examples') and not st.session_state.get('processed_new_sources'):
             st.error("Veuillez d'abord traiter vos documents dans la section upload.")
@@ -423,9 +430,13 @@ def show_generation_section():
                 if logger.isEnabledFor(logging.DEBUG):
                     st.exception(e)
 
+@st.fragment
 def show_results_section():
     """
     Section d'affichage et d'export des résultats.
+    
+    Fragment Streamlit : les exports PDF/DOCX ne relancent que cette section,
+    sans réexécuter l'upload ni la génération.
     """
     st.markdown("---")
     st.subheader("📄 Document généré")
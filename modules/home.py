@@ -0,0 +1,200 @@
+import markdown
+import streamlit as st
+
+from components.service_status import fetch_service_status, STATUS_POLL_INTERVAL
+
+# Textes Markdown de la page d'accueil
+_INTRO_MD = """
+## 🧠 Architecture 3+1 Révolutionnaire
+
+InspireDoc révolutionne la génération de documents avec son **intelligence de transformation**. 
+L'IA ne se contente plus de copier - elle **comprend** et **applique** des transformations intelligentes.
+
+### 💡 Innovation unique :
+L'IA analyse comment un document ancien a été transformé en exemple, puis applique cette même transformation sur vos nouveaux documents.
+"""
+
+_WORKFLOW_TITLE_MD = """
+### 🔄 Workflow Architecture 3+1
+"""
+
+_GUIDE_MD = """
+### 🚀 Nouveau workflow révolutionnaire :
+
+1. **📜 Document source ancien** : Uploadez votre document de référence original
+2. **🎨 Document exemple construit** : Uploadez un exemple créé à partir de la source
+3. **📄 Nouveau document source** : Uploadez le nouveau contenu à traiter
+4. **💬 Description optionnelle** : Ajoutez des instructions personnalisées
+5. **🧠 Génération intelligente** : L'IA analyse la transformation et l'applique
+6. **📖 Rendu et export** : Prévisualisez et exportez en PDF/DOCX
+
+### 💡 Exemple concret :
+- **Ancien** : Rapport technique brut
+- **Exemple** : Le même rapport transformé en présentation
+- **Nouveau** : Nouveau rapport technique à transformer
+- **Résultat** : Nouvelle présentation avec le même style !
+"""
+
+def _render_markdown(text: str) -> str:
+    """
+    Convertit un texte Markdown statique en HTML.
+    
+    Args:
+        text: Texte Markdown
+        
+    Returns:
+        Bloc HTML prêt pour st.html
+    """
+    html = markdown.markdown(text.strip())
+    return f'<div class="markdown-content">{html}</div>'
+
+# Rendus une seule fois à l'import : le navigateur reçoit du HTML statique
+# au lieu de repasser ces textes dans son moteur Markdown à chaque rerun
+_INTRO_HTML = _render_markdown(_INTRO_MD + _WORKFLOW_TITLE_MD)
+_GUIDE_HTML = _render_markdown(_GUIDE_MD)
+
+# Blocs HTML statiques de la page d'accueil
+_WORKFLOW_BOXES = (
+    """
+    <div class="feature-box">
+        <h4>📜 1. Source Ancien</h4>
+        <p>Document de référence original</p>
+    </div>
+    """,
+    """
+    <div class="feature-box">
+        <h4>🎨 2. Exemple Construit</h4>
+        <p>Transformation appliquée</p>
+    </div>
+    """,
+    """
+    <div class="feature-box">
+        <h4>📄 3. Nouveau Source</h4>
+        <p>Information à traiter</p>
+    </div>
+    """,
+    """
+    <div class="feature-box">
+        <h4>💬 4. Description</h4>
+        <p>Instructions optionnelles</p>
+    </div>
+    """,
+)
+
+_FEATURE_BOXES = (
+    """
+    <div class="feature-box">
+        <h4>🧠 Intelligence de Transformation</h4>
+        <p>L'IA comprend le COMMENT transformer, pas seulement le QUOI</p>
+        <ul>
+            <li>Analyse des patterns de transformation</li>
+            <li>Application contextuelle intelligente</li>
+        </ul>
+    </div>
+    """,
+    """
+    <div class="feature-box">
+        <h4>🎨 Rendu Adaptatif</h4>
+        <p>Interface qui s'adapte automatiquement</p>
+        <ul>
+            <li>Thèmes sombre/clair automatiques</li>
+            <li>Rendu Markdown professionnel</li>
+        </ul>
+    </div>
+    """,
+    """
+    <div class="feature-box">
+        <h4>📄 Upload Intelligent 3 Zones</h4>
+        <p>Architecture 3+1 révolutionnaire</p>
+        <ul>
+            <li>Source ancien + Exemple construit + Nouveau source</li>
+            <li>Description utilisateur optionnelle</li>
+        </ul>
+    </div>
+    """,
+    """
+    <div class="feature-box">
+        <h4>🐳 Docker & Hot Reload</h4>
+        <p>Développement et déploiement optimisés</p>
+        <ul>
+            <li>Containerisation complète</li>
+            <li>Rechargement automatique</li>
+        </ul>
+    </div>
+    """,
+)
+
+# Chaque section est émise en un seul bloc HTML (grille CSS)
+_WORKFLOW_HTML = '<div class="feature-grid feature-grid-4">' + "".join(_WORKFLOW_BOXES) + '</div>'
+_FEATURES_HTML = '<div class="feature-grid feature-grid-2">' + "".join(_FEATURE_BOXES) + '</div>'
+
+_SUCCESS_SERVICE_HTML = '<div class="success-box">✅ Service InspireDoc initialisé avec succès</div>'
+_SUCCESS_LLM_HTML = '<div class="success-box">✅ Connexion LLM opérationnelle</div>'
+_ERROR_LLM_HTML = '<div class="error-box">❌ Problème de connexion LLM</div>'
+_ERROR_SERVICE_HTML = '<div class="error-box">❌ Erreur d\'initialisation du service</div>'
+_PENDING_STATUS_HTML = '<div class="info-box">⏳ Vérification du statut du système en cours...</div>'
+_ERROR_STATUS_HTML = '<div class="error-box">❌ Impossible de vérifier le statut du système</div>'
+
+_INFO_CONFIG_HTML = """
+<div class="info-box">
+    <strong>Configuration requise:</strong><br>
+    Assurez-vous que les variables d'environnement suivantes sont définies:
+    <ul>
+        <li><code>GPT4O_API_KEY</code> - Votre clé API GPT-4o</li>
+        <li><code>GPT4O_ENDPOINT</code> - L'endpoint de votre service GPT-4o</li>
+    </ul>
+</div>
+"""
+
+def show_home_interface():
+    """
+    Interface de la page d'accueil.
+    """
+    st.header("🚀 Bienvenue sur InspireDoc 2.0")
+    
+    # Description révolutionnaire et workflow 3+1
+    st.html(_INTRO_HTML)
+    
+    st.html(_WORKFLOW_HTML)
+    
+    # Fonctionnalités révolutionnaires
+    st.subheader("✨ Fonctionnalités révolutionnaires")
+    
+    st.html(_FEATURES_HTML)
+    
+    # Guide Architecture 3+1
+    st.subheader("🎯 Guide Architecture 3+1")
+    
+    st.html(_GUIDE_HTML)
+    
+    # Statut du système (fragment rafraîchi indépendamment du reste de la page)
+    st.subheader("🔧 Statut du système")
+    _show_status_panel()
+
+@st.fragment(run_every=STATUS_POLL_INTERVAL)
+def _show_status_panel():
+    """
+    Affiche le statut du système.
+    
+    Fragment Streamlit : il se réexécute seul toutes les STATUS_POLL_INTERVAL
+    secondes pour refléter le dernier statut connu, sans relancer la page.
+    """
+    status = fetch_service_status()
+    
+    if status.get('pending', False):
+        st.html(_PENDING_STATUS_HTML)
+    elif status.get('init_error', False):
+        st.html(_ERROR_STATUS_HTML)
+        st.error(f"Erreur: {status['error']}")
+        st.html(_INFO_CONFIG_HTML)
+    elif status.get('service_initialized', False):
+        st.html(_SUCCESS_SERVICE_HTML)
+        
+        if status.get('llm_connection', False):
+            st.html(_SUCCESS_LLM_HTML)
+        else:
+            st.html(_ERROR_LLM_HTML)
+    else:
+        st.html(_ERROR_SERVICE_HTML)
+        if 'error' in status:
+            st.error(f"Erreur: {status['error']}")
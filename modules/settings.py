@@ -217,6 +217,42 @@ def show_ui_settings():
             }
             st.success("✅ Préférences sauvegardées pour cette session")
 
+def _show_component_status(status: Dict[str, Any]):
+    """
+    Affiche le statut détaillé des composants.
+    
+    Args:
+        status: Statut du service
+    """
+    # Affichage du statut
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("**Service principal:**")
+        if status.get('service_initialized', False):
+            st.success("✅ Service initialisé")
+        else:
+            st.error("❌ Service non initialisé")
+        
+        st.markdown("**Connexion LLM:**")
+        if status.get('llm_connection', False):
+            st.success("✅ Connexion opérationnelle")
+        else:
+            st.error("❌ Connexion échouée")
+    
+    with col2:
+        st.markdown("**Dossiers:**")
+        directories = status.get('directories_ready', {})
+        for name, ready in directories.items():
+            if ready:
+                st.success(f"✅ {name.capitalize()}")
+            else:
+                st.error(f"❌ {name.capitalize()}")
+    
+    # Informations détaillées
+    if st.checkbox("Afficher les détails techniques"):
+        st.json(status)
+
 def show_system_info():
     """
     Informations système et diagnostics.
@@ -225,41 +261,17 @@ def show_system_info():
     
     with st.expander("Statut des composants", expanded=True):
         try:
-            from core.services.document_service import DocumentService
-            
-            # Test du service
-            with st.spinner("Vérification du statut..."):
-                service = DocumentService()
-                status = service.get_service_status()
-            
-            # Affichage du statut
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.markdown("**Service principal:**")
-                if status.get('service_initialized', False):
-                    st.success("✅ Service initialisé")
-                else:
-                    st.error("❌ Service non initialisé")
-                
-                st.markdown("**Connexion LLM:**")
-                if status.get('llm_connection', False):
-                    st.success("✅ Connexion opérationnelle")
-                else:
-                    st.error("❌ Connexion échouée")
+            from components.service_status import fetch_service_status
             
-            with col2:
-                st.markdown("**Dossiers:**")
-                directories = status.get('directories_ready', {})
-                for name, ready in directories.items():
-                    if ready:
-                        st.success(f"✅ {name.capitalize()}")
-                    else:
-                        st.error(f"❌ {name.capitalize()}")
+            # Dernier statut connu (vérifié en arrière-plan)
+            status = fetch_service_status()
+            if status.get('init_error', False):
+                raise RuntimeError(status.get('error', 'Service indisponible'))
             
-            # Informations détaillées
-            if st.checkbox("Afficher les détails techniques"):
-                st.json(status)
+            if status.get('pending', False):
+                st.info("⏳ Vérification du statut en cours...")
+            else:
+                _show_component_status(status)
                 
         except Exception as e:
             st.error(f"❌ Erreur lors de la vérification du statut: {str(e)}")
@@ -305,7 +317,9 @@ def show_system_info():
         with col1:
             if st.button("🔄 Redémarrer le service"):
                 try:
-                    # Réinitialiser le service dans la session
+                    # Réinitialiser le service partagé et celui de la session
+                    from components.service_status import get_document_service
+                    get_document_service.clear()
                     if 'document_service' in st.session_state:
                         del st.session_state.document_service
                     st.success("✅ Service redémarré (rechargez la page)")